@@ -1,6 +1,62 @@
 from abc import ABC, abstractmethod
-import matplotlib.pyplot as plt
+from functools import lru_cache
+import matplotlib
+import matplotlib.colors as mcolors
 import numpy as np
+from PIL import Image
+
+
+@lru_cache(maxsize=32)
+def _cmap_ramp(name, n, reverse=False):
+    """
+    Liefert n Farben aus der Farbpalette name im Bereich 0.15 bis 0.85.
+    Das Ergebnis wird pro (name, n, reverse) zwischengespeichert und ist
+    schreibgeschützt; Aufrufer, die es verändern wollen, müssen es kopieren.
+    
+    Parameter:
+    ----------
+    name : str
+        Name einer Matplotlib-Farbpalette
+    n : int
+        Anzahl der Farben
+    reverse : bool, optional
+        Reihenfolge der Farben umkehren
+        
+    Returns:
+    --------
+    numpy.ndarray
+        Array der Form (n, 4) mit RGBA-Werten
+    """
+    colors = matplotlib.colormaps[name](np.linspace(0.15, 0.85, n))
+    if reverse:
+        colors = colors[::-1].copy()
+    colors.flags.writeable = False
+    return colors
+
+
+def _shade_ramp(base_color, n):
+    """
+    Erzeugt n Farbtöne einer Grundfarbe von hell nach dunkel als RGBA-Array.
+    Der Faktor 0.5 + i/n wird für alle Abstufungen in einem Schritt berechnet,
+    ohne den Umweg über Hex-Strings.
+    
+    Parameter:
+    ----------
+    base_color : tuple
+        RGB-Werte der Grundfarbe im Bereich 0..1
+    n : int
+        Anzahl der Abstufungen
+        
+    Returns:
+    --------
+    numpy.ndarray
+        Array der Form (n, 4) mit RGBA-Werten
+    """
+    scale = 0.5 + np.arange(n, dtype=np.float64) / n
+    out = np.ones((n, 4))
+    out[:, :3] = np.minimum(1.0, np.outer(scale, base_color))
+    return out
+
 
 
 class AbstractPlot(ABC):
@@ -33,6 +89,7 @@ class AbstractPlot(ABC):
         self.filename = filename
         self.color = color  # Farbparameter für einzelne Farbe
         self.cmap = cmap    # Farbparameter für Farbpalette
+        self.fig = None     # Zuletzt mit plot() erstellte Figur
 
     @abstractmethod
     def plot(self):
@@ -46,3 +103,60 @@ class AbstractPlot(ABC):
             (fig, ax) Matplotlib-Figur und Achsenobjekt
         """
         pass
+
+    def save(self, path=None):
+        """
+        Speichert das Diagramm als PNG direkt aus dem Agg-Puffer der Figur.
+        Umgeht die Formatauswahl von savefig() und schreibt mit niedriger
+        Kompressionsstufe; Auflösung ist die DPI der Figur, ohne Zuschnitt.
+        Für andere Formate, DPI-Werte oder bbox_inches weiterhin fig.savefig() verwenden.
+        
+        Parameter:
+        ----------
+        path : str, optional
+            Zielpfad der PNG-Datei (Standard: self.filename)
+            
+        Returns:
+        --------
+        str
+            Der Pfad der gespeicherten Datei
+        """
+        if self.fig is None:
+            self.plot()
+        path = path or self.filename
+
+        canvas = self.fig.canvas
+        canvas.draw()
+        Image.fromarray(np.asarray(canvas.buffer_rgba())).save(
+            path, format="png", optimize=False, compress_level=1)
+        return path
+
+    def _resolve_colors(self, n, reverse=False, shade=True):
+        """
+        Bestimmt die Farben für n Kategorien aus Farbpalette, Einzelfarbe oder Standardschema.
+        
+        Parameter:
+        ----------
+        n : int
+            Anzahl der benötigten Farben
+        reverse : bool, optional
+            Reihenfolge der Palettenfarben umkehren
+        shade : bool, optional
+            Einzelfarbe in Abstufungen von hell nach dunkel aufteilen,
+            sonst wird sie unverändert für alle Kategorien verwendet
+            
+        Returns:
+        --------
+        numpy.ndarray or tuple
+            Array der Form (n, 4) mit RGBA-Werten, bei einer unveränderten
+            Einzelfarbe (shade=False) nur deren RGBA-Tupel
+        """
+        if self.cmap:
+            return _cmap_ramp(self.cmap, n, reverse=reverse)
+        if self.color:
+            if shade:
+                return _shade_ramp(mcolors.to_rgb(self.color), n)
+            # Eine Farbe für alle Balken - matplotlib akzeptiert sie direkt
+            return mcolors.to_rgba(self.color)
+        # Standardfarbschema wenn nichts angegeben
+        return _cmap_ramp('RdYlGn_r', n, reverse=reverse)
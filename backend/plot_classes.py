@@ -1,344 +1,455 @@
-import matplotlib.pyplot as plt
-import numpy as np
-from backend.plot_abs import AbstractPlot
-
-
-class BarChart(AbstractPlot):
-    """
-    Implementierung eines gestapelten Prozent-Balkendiagramms.
-    Zeigt die prozentuale Verteilung der Kategorien pro Gruppe.
-    """
-    def __init__(self, title, category_names, results, filename, color=None, cmap=None):
-        """
-        Initialisiert das Balkendiagramm mit den übergebenen Parametern.
-        
-        Parameter:
-        ----------
-        title : str
-            Titel des Diagramms
-        category_names : list
-            Namen der Kategorien/Segmente
-        results : dict
-            Dictionary mit den Datenreihen als Listen
-        filename : str
-            Name der Ausgabedatei
-        color : str, optional
-            Einzelne Farbe für das Diagramm
-        cmap : str, optional
-            Name einer Matplotlib-Farbpalette
-        """
-        super().__init__(results, category_names, title, filename, color, cmap)
-
-    def plot(self):
-        """
-        Erstellt ein gestapeltes Prozent-Balkendiagramm.
-        
-        Returns:
-        --------
-        tuple
-            (fig, ax) Matplotlib-Figur und Achsenobjekt
-        """
-        labels = list(self.results.keys())
-        data = np.array(list(self.results.values()))
-
-        # Berechne Prozentanteile und kumulative Summen für Stapelung
-        data_percent = data / data.sum(axis=1, keepdims=True) * 100
-        data_cum = data_percent.cumsum(axis=1)
-        
-        # Bestimme die Anzahl der Kategorien direkt
-        num_categories = len(self.category_names)
-        
-        # Verwende die übergebene Farbe oder Farbpalette, wenn angegeben
-        if self.cmap:
-            category_colors = plt.colormaps[self.cmap](
-                np.linspace(0.15, 0.85, num_categories))
-        elif self.color:
-            # Für Balkendiagramme brauchen wir verschiedene Abstufungen einer Farbe
-            import matplotlib.colors as mcolors
-            base_color = mcolors.to_rgb(self.color)
-            # Erzeuge Farbtöne von hell (links) nach dunkel (rechts)
-            category_colors = [mcolors.to_rgba(mcolors.rgb2hex([
-                min(1.0, c * (0.5 + 1.0 * i/num_categories)) for c in base_color
-            ])) for i in range(num_categories)]
-        else:
-            # Standardfarbschema wenn nichts angegeben
-            category_colors = plt.colormaps['RdYlGn_r'](
-                np.linspace(0.15, 0.85, num_categories))
-
-        fig, ax = plt.subplots(figsize=(9.4, 5))
-        ax.set_title(self.title, pad=30)
-        ax.invert_yaxis()
-        
-        # X-Achse sichtbar machen, aber keine Tick-Labels anzeigen
-        ax.xaxis.set_visible(True)
-        ax.set_xticklabels([])  # Keine Tick-Labels
-        ax.set_xlim(0, 100)
-
-        # Zeichne die Balken für jede Kategorie
-        for i, (colname, color) in enumerate(zip(self.category_names, category_colors)):
-            widths = data_percent[:, i]
-            starts = data_cum[:, i] - widths
-            rects = ax.barh(labels, widths, left=starts, height=0.7, 
-                           label=colname, color=color)
-
-            # Farbe des Texts bestimmen - Bei dunklen Hintergründen weißen Text verwenden
-            if isinstance(color, str):
-                text_color = 'black'  # Standard für benannte Farben
-            else:
-                r, g, b, _ = color
-                text_color = 'white' if (r * 0.299 + g * 0.587 + b * 0.114) < 0.5 else 'black'
-                
-            # Beschriftung der Balken mit Wert und Prozentsatz
-            ax.bar_label(rects, label_type='center', color=text_color,
-                         labels=[f'{y} \n{x:.0f}%' for x, y in zip(widths, data[:, i])])
-
-        # Legende über dem Diagramm positionieren
-        ax.legend(ncols=len(self.category_names), 
-                 bbox_to_anchor=(0, 1.005), 
-                 loc='lower left', 
-                 fontsize='small')
-        
-        # Y-Achse-Beschriftung default
-        # ax.set_ylabel("Kategorien")
-        
-        return fig, ax
-
-
-class HorizontalBarChart(AbstractPlot):
-    """
-    Implementierung eines horizontalen Balkendiagramms.
-    Zeigt absolute Werte pro Kategorie.
-    """
-    def __init__(self, title, category_names, results, filename, color=None, cmap=None):
-        """
-        Initialisiert das horizontale Balkendiagramm mit den übergebenen Parametern.
-        
-        Parameter entsprechen denen der Basisklasse AbstractPlot.
-        """
-        super().__init__(results, category_names, title, filename, color, cmap)
-
-    def plot(self):
-        """
-        Erstellt ein horizontales Balkendiagramm.
-        
-        Returns:
-        --------
-        tuple
-            (fig, ax) Matplotlib-Figur und Achsenobjekt
-        """
-        data = np.array(list(self.results.values()))
-        
-        # Sichere Bestimmung der Anzahl der Kategorien
-        num_categories = len(self.category_names)
-        
-        # Farbkonfiguration
-        if self.cmap:
-            category_colors = plt.colormaps[self.cmap](
-                np.linspace(0.15, 0.85, num_categories))[::-1]
-        elif self.color:
-            category_colors = [self.color] * num_categories
-        else:
-            category_colors = plt.colormaps['RdYlGn_r'](
-                np.linspace(0.15, 0.85, num_categories))[::-1]
-
-        # Gesamt-Datensumme für Prozentberechnung
-        total = np.sum(data)
-        fig, ax = plt.subplots(figsize=(12, 6))
-        ax.set_title(self.title, pad=30)
-
-        # Parameter für die Balken
-        bar_height = 0.5
-        y_pos = np.arange(len(self.category_names))
-        
-        # Verwende die erste (oder einzige) Farbe aus category_colors
-        bar_color = category_colors[0] if isinstance(category_colors, list) else category_colors
-        
-        # Stelle sicher, dass data[0] ein Array ist, wenn data flach ist
-        if data.ndim == 1:
-            bars = ax.barh(y_pos, data, height=bar_height, label='Results', color=bar_color)
-            # Für die Textanzeige brauchen wir Einzelwerte
-            values = data
-        else:
-            bars = ax.barh(y_pos, data[0], height=bar_height, label='Results', color=bar_color)
-            # Für die Textanzeige brauchen wir Einzelwerte
-            values = data[0]
-
-        # Default-Achsenbeschriftungen
-        ax.set_xlabel('Anzahl')
-        ax.set_ylabel('Kategorien')
-        
-        # Y-Achsen-Beschriftung mit Kategorienamen
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(self.category_names)
-        # Dynamische X-Achsen-Ticks berechnen
-        ax.set_xticks(np.linspace(0, max(values) * 1.1, 6).astype(int))
-
-        # Beschriftung der Balken mit Wert und Prozent
-        for i, bar in enumerate(bars):
-            absolute_value = bar.get_width()
-            percentage = (absolute_value / total) * 100 if total > 0 else 0
-
-            # Positioniere Text innerhalb oder neben dem Balken
-            x_position = absolute_value * 0.05 if absolute_value > 0 else 0.1
-            ha_value = 'left'
-
-            ax.text(x_position, bar.get_y() + bar.get_height() / 2,
-                    f'{absolute_value} \n{percentage:.0f}%', 
-                    va='center', ha=ha_value, fontsize=10, color='black')
-
-        return fig, ax
-
-
-class PieChart(AbstractPlot):
-    """
-    Implementierung eines Kreisdiagramms (Donut-Stil).
-    Zeigt die proportionale Verteilung der Kategorien.
-    """
-    def __init__(self, title, labels, values, filename, color=None, cmap=None):
-        """
-        Initialisiert das Kreisdiagramm mit den übergebenen Parametern.
-        
-        Parameter:
-        ----------
-        title : str
-            Titel des Diagramms
-        labels : list
-            Liste der Kategorienamen
-        values : list
-            Liste der zugehörigen Werte
-        filename : str
-            Name der Ausgabedatei
-        color : str, optional
-            Einzelne Farbe für das Diagramm
-        cmap : str, optional
-            Name einer Matplotlib-Farbpalette
-        """
-        super().__init__(results={'values': values}, category_names=labels, 
-                        title=title, filename=filename, color=color, cmap=cmap)
-        self.labels = labels
-        self.values = values
-
-    def plot(self):
-        """
-        Erstellt ein Kreisdiagramm im Donut-Stil.
-        
-        Returns:
-        --------
-        tuple
-            (fig, ax) Matplotlib-Figur und Achsenobjekt
-        """
-        # Summe der Werte für Prozentberechnung
-        val_sum = sum(self.values)
-        
-        # Sichere Bestimmung der Anzahl der Labels
-        num_labels = len(self.labels)
-        
-        # Farbkonfiguration
-        if self.cmap:
-            colors = plt.colormaps[self.cmap](
-                np.linspace(0.15, 0.85, num_labels))[::-1]
-        elif self.color:
-            # Für Kreisdiagramme - Verwende die gleiche Farbabstufung wie beim BarChart
-            import matplotlib.colors as mcolors
-            base_color = mcolors.to_rgb(self.color)
-            # Erzeuge Farbtöne mit der gleichen Formel wie beim BarChart
-            colors = [mcolors.to_rgba(mcolors.rgb2hex([
-                min(1.0, c * (0.5 + 1.0 * i/num_labels)) for c in base_color
-            ])) for i in range(num_labels)]
-            colors = np.array(colors)  # Konvertiere zu numpy Array für Konsistenz
-        else:
-            colors = plt.colormaps['RdYlGn_r'](
-                np.linspace(0.15, 0.85, num_labels))[::-1]
-
-        fig = plt.figure(figsize=(8, 6), dpi=100)
-        ax = fig.add_subplot(1, 1, 1)
-
-        # Etiketten und Werte kopieren, da wir sie verändern werden
-        pie_labels = self.labels.copy()
-        pie_values = self.values.copy()
-        
-        # Leeres Zentrum hinzufügen für Donut-Stil
-        pie_labels.append("")
-        pie_values.append(sum(pie_values))
-        
-        # Füge eine weiße Farbe für das Zentrum hinzu
-        if len(colors.shape) > 1:
-            # Wenn colors bereits ein 2D-Array ist (RGBA-Werte)
-            colors_with_white = np.vstack([colors, [1, 1, 1, 1]])
-        else:
-            # Wenn colors eine Liste von benannten Farben ist
-            colors_with_white = list(colors) + ['white']
-
-        # Diagramm erstellen
-        wedges, texts, autotexts = ax.pie(
-            pie_values, labels=None, colors=colors_with_white,
-            wedgeprops={'width': 0.3, 'edgecolor': 'white'},
-            autopct='%1.0f%%', startangle=0, pctdistance=0.85
-        )
-
-        # Beschriftung der Segmente anpassen
-        for id, text in enumerate(autotexts):
-            if text.get_text() == '50.0%':
-                # Mittleres weißes Segment nicht beschriften
-                text.set_text('')
-            else:
-                # Wert und Prozentsatz anzeigen
-                text.set_text(f"{pie_values[id]} \n{int(round(pie_values[id] / val_sum * 100, 0))}%")
-                text.set_color('black')
-
-        # Weißer Kreis in der Mitte für Donut-Effekt
-        ax.add_artist(plt.Circle((0, 0), 0.6, color='white'))
-        ax.set_aspect('equal')
-        ax.set_ylim(0, 1)
-        ax.set_title(self.title, pad=20)
-        
-        # Labels entfernen, da sie bei Kreisdiagrammen nicht sinnvoll sind
-        ax.set_xticks([])
-        ax.set_yticks([])
-        
-        # Legende hinzufügen, aber ohne das leere Zentrum
-        if len(wedges) > 1:
-            ax.legend(
-                wedges[:len(wedges)-1], 
-                pie_labels[:len(pie_labels)-1], 
-                loc="center"
-            )
-        
-        return fig, ax
-
-
-if __name__ == "__main__":
-    # Test-Ausführung der Diagrammklassen
-    
-    # Test BarChart
-    bar_chart = BarChart(
-        title="Digitalisierung Unterrichtsmaterialien in Fach 1",
-        category_names=['Vollständig digital', 'Überwiegend digital', 
-                       'Überwiegend analog', 'Vollständig analog'],
-        results={
-            'derzeitiger Stand': [4, 7, 9, 2],
-            'zukünftiger Stand': [7, 7, 6, 2],
-        },
-        filename="bar_chart.png"
-    )
-    bar_chart.plot()
-
-    # Test HorizontalBarChart
-    horizontal_bar_chart = HorizontalBarChart(
-        title="Softwarenutzung in Fach 1",
-        category_names=['CAD Software', 'Chat GPT', 'Citrix', 'MathCAD', 
-                       'Moodle (E-Learning)', 'MS-Office Produkte', 
-                       'MS-Teams', 'Sonstige Software'][::-1],
-        results={"results": [5, 4, 1, 23, 9, 3, 2, 2][::-1]},
-        filename="horizontal_bar_chart.png"
-    )
-    horizontal_bar_chart.plot()
-
-    # Test PieChart
-    pie_chart = PieChart(
-        title="Digitale Tools in Fach 1",
-        labels=["Ja", "Nein"][::-1],
-        values=[21, 9][::-1],
-        filename="pie_chart.png"
-    )
-    pie_chart.plot()
+import matplotlib
+matplotlib.use("Agg")  # Nicht-interaktives Backend, die Diagramme werden nur gerendert/gespeichert
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.container import BarContainer
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle
+from backend.plot_abs import AbstractPlot
+
+
+def _new_figure(figsize, dpi=None):
+    """
+    Erzeugt eine Figure direkt mit einer Agg-Canvas, ohne die pyplot-Zustandsmaschine.
+    Die Figur wird nicht im pyplot-Figurenmanager registriert und muss daher
+    nicht mit plt.close() freigegeben werden.
+    
+    Parameter:
+    ----------
+    figsize : tuple
+        Breite und Höhe der Figur in Zoll
+    dpi : int, optional
+        Auflösung der Figur (Standard: rcParams)
+        
+    Returns:
+    --------
+    matplotlib.figure.Figure
+        Die neue, leere Figur
+    """
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _format_bar_labels(data, data_percent):
+    """
+    Erzeugt die zweizeiligen Beschriftungen (Wert und Prozentsatz) aller Segmente,
+    spaltenweise gruppiert (eine Liste pro Kategorie).
+    Die Arrays werden vorab mit tolist() in Python-Zahlen umgewandelt, damit
+    die Formatierung nicht pro Element auf NumPy-Skalare zugreifen muss.
+    
+    Parameter:
+    ----------
+    data : numpy.ndarray
+        Absolute Werte, Form (Gruppen, Kategorien)
+    data_percent : numpy.ndarray
+        Prozentanteile, gleiche Form wie data
+        
+    Returns:
+    --------
+    list
+        Liste pro Kategorie mit den Beschriftungen aller Gruppen
+    """
+    return [[f'{y} \n{x:.0f}%' for x, y in zip(pct_col, val_col)]
+            for pct_col, val_col in zip(data_percent.T.tolist(), data.T.tolist())]
+
+
+class BarChart(AbstractPlot):
+    """
+    Implementierung eines gestapelten Prozent-Balkendiagramms.
+    Zeigt die prozentuale Verteilung der Kategorien pro Gruppe.
+    """
+    # Bereits aufgebaute Diagramme pro Layout (Kategorien, Gruppen, Farben)
+    _template_cache = {}
+    _template_cache_size = 16
+
+    def __init__(self, title, category_names, results, filename, color=None, cmap=None,
+                 reuse_template=True):
+        """
+        Initialisiert das Balkendiagramm mit den übergebenen Parametern.
+        
+        Parameter:
+        ----------
+        title : str
+            Titel des Diagramms
+        category_names : list
+            Namen der Kategorien/Segmente
+        results : dict
+            Dictionary mit den Datenreihen als Listen
+        filename : str
+            Name der Ausgabedatei
+        color : str, optional
+            Einzelne Farbe für das Diagramm
+        cmap : str, optional
+            Name einer Matplotlib-Farbpalette
+        reuse_template : bool, optional
+            Diagramme mit gleichem Layout wiederverwenden (Standard). Mit False wird
+            immer eine eigene Figur erstellt, die nicht mit anderen Aufrufen geteilt wird
+        """
+        super().__init__(results, category_names, title, filename, color, cmap)
+        self.reuse_template = reuse_template
+
+    def plot(self):
+        """
+        Erstellt ein gestapeltes Prozent-Balkendiagramm.
+        Wurde bereits ein Diagramm mit gleichem Layout erstellt (und ist reuse_template
+        gesetzt), wird dieses wiederverwendet und nur Titel, Balken und Beschriftungen
+        aktualisiert.
+        Die zurückgegebene Figur muss daher vor dem nächsten Aufruf mit gleichem
+        Layout gerendert bzw. gespeichert werden.
+        
+        Returns:
+        --------
+        tuple
+            (fig, ax) Matplotlib-Figur und Achsenobjekt
+        """
+        labels = list(self.results.keys())
+        # Bereits vorhandene ndarrays werden ohne Kopie übernommen
+        data = np.stack([np.asarray(v) for v in self.results.values()])
+
+        # Berechne Prozentanteile und kumulative Summen für Stapelung
+        # (Skalierungsfaktor pro Zeile vorab, damit nur ein Durchlauf über data nötig ist)
+        data_percent = data * (100.0 / data.sum(axis=1, keepdims=True))
+        data_cum = np.cumsum(data_percent, axis=1)
+
+        # Startpositionen aller Segmente einmalig berechnen, im Loop nur Spalten-Views
+        starts_all = data_cum - data_percent
+
+        # Beschriftungen aller Segmente (Wert und Prozentsatz) vorab spaltenweise erzeugen
+        bar_labels = _format_bar_labels(data, data_percent)
+
+        # Vorhandenes Diagramm mit gleichem Layout wiederverwenden - nur wenn jede Gruppe
+        # genau einen Wert pro Kategorie hat; sonst meldet der Neuaufbau den Fehler, bevor
+        # die geteilte Figur verändert wird
+        key = (tuple(self.category_names), tuple(labels), self.cmap, self.color)
+        template = BarChart._template_cache.get(key) if self.reuse_template else None
+        if template is not None and data.shape[1] == len(self.category_names):
+            fig, ax, containers, annotations = template
+            ax.set_title(self.title, pad=30)
+            # Achsenbeschriftungen eines vorherigen Aufrufs zurücksetzen
+            ax.set_xlabel('')
+            ax.set_ylabel('')
+            for i, (rects, texts) in enumerate(zip(containers, annotations)):
+                for rect, text, start, width, label in zip(
+                        rects, texts, starts_all[:, i], data_percent[:, i], bar_labels[i]):
+                    rect.set_x(start)
+                    rect.set_width(width)
+                    # Die Position der Beschriftung ist an den Balken gekoppelt (bar_label)
+                    text.set_text(label)
+            self.fig = fig
+            return fig, ax
+        
+        # Bestimme die Anzahl der Kategorien direkt
+        num_categories = len(self.category_names)
+        
+        # Verwende die übergebene Farbe oder Farbpalette, wenn angegeben
+        # Für Balkendiagramme brauchen wir verschiedene Abstufungen einer Farbe (hell links, dunkel rechts)
+        category_colors = self._resolve_colors(num_categories)
+
+        # Farbe des Texts bestimmen - Bei dunklen Hintergründen weißen Text verwenden
+        # Luminanz aller Kategorien in einem Schritt berechnen
+        luminance = category_colors[:, :3] @ np.array([0.299, 0.587, 0.114])
+        text_colors = np.where(luminance < 0.5, 'white', 'black')
+
+        fig = _new_figure(figsize=(9.4, 5))
+        ax = fig.add_subplot(111)
+        ax.set_title(self.title, pad=30)
+        ax.invert_yaxis()
+        
+        # X-Achse sichtbar machen, aber keine Tick-Labels anzeigen
+        ax.xaxis.set_visible(True)
+        ax.set_xticklabels([])  # Keine Tick-Labels
+        ax.set_xlim(0, 100)
+
+        # Zeichne alle Segmente in einem einzigen barh-Aufruf (kategorieweise hintereinander)
+        num_groups = len(labels)
+        all_rects = ax.barh(labels * num_categories, data_percent.T.ravel(),
+                            left=starts_all.T.ravel(), height=0.7,
+                            color=np.repeat(category_colors, num_groups, axis=0))
+
+        # Pro Kategorie einen eigenen Container für Legende und Beschriftung bilden
+        containers = []
+        annotations = []
+        for i, colname in enumerate(self.category_names):
+            rects = BarContainer(all_rects.patches[i * num_groups:(i + 1) * num_groups],
+                                 datavalues=data_percent[:, i], orientation='horizontal',
+                                 label=colname)
+            ax.add_container(rects)
+                
+            # Beschriftung der Balken mit Wert und Prozentsatz
+            texts = ax.bar_label(rects, label_type='center', color=text_colors[i],
+                                 labels=bar_labels[i])
+            containers.append(rects)
+            annotations.append(texts)
+
+        # Legende über dem Diagramm positionieren
+        ax.legend(ncols=len(self.category_names), 
+                 bbox_to_anchor=(0, 1.005), 
+                 loc='lower left', 
+                 fontsize='small')
+        
+        # Y-Achse-Beschriftung default
+        # ax.set_ylabel("Kategorien")
+
+        # Diagramm als Vorlage für weitere Aufrufe mit gleichem Layout merken
+        if self.reuse_template:
+            if len(BarChart._template_cache) >= BarChart._template_cache_size:
+                BarChart._template_cache.pop(next(iter(BarChart._template_cache)))
+            BarChart._template_cache[key] = (fig, ax, containers, annotations)
+        
+        self.fig = fig
+        return fig, ax
+
+
+class HorizontalBarChart(AbstractPlot):
+    """
+    Implementierung eines horizontalen Balkendiagramms.
+    Zeigt absolute Werte pro Kategorie.
+    """
+    # Bereits aufgebaute Diagramme pro Layout (Kategorien, Farben)
+    _template_cache = {}
+    _template_cache_size = 16
+    def __init__(self, title, category_names, results, filename, color=None, cmap=None,
+                 reuse_template=True):
+        """
+        Initialisiert das horizontale Balkendiagramm mit den übergebenen Parametern.
+        
+        Parameter entsprechen denen der Basisklasse AbstractPlot, zusätzlich
+        reuse_template wie bei BarChart.
+        """
+        super().__init__(results, category_names, title, filename, color, cmap)
+        self.reuse_template = reuse_template
+
+    def plot(self):
+        """
+        Erstellt ein horizontales Balkendiagramm.
+        Wurde bereits ein Diagramm mit gleichem Layout erstellt (und ist reuse_template
+        gesetzt), wird dieses wiederverwendet und nur Titel, Balken, Achse und
+        Beschriftungen aktualisiert.
+        Die zurückgegebene Figur muss daher vor dem nächsten Aufruf mit gleichem
+        Layout gerendert bzw. gespeichert werden.
+        
+        Returns:
+        --------
+        tuple
+            (fig, ax) Matplotlib-Figur und Achsenobjekt
+        """
+        data = np.stack([np.asarray(v) for v in self.results.values()])
+        
+        # Sichere Bestimmung der Anzahl der Kategorien
+        num_categories = len(self.category_names)
+
+        # Gesamt-Datensumme für Prozentberechnung
+        total = np.sum(data)
+
+        # Parameter für die Balken
+        bar_height = 0.5
+        y_pos = np.arange(len(self.category_names))
+        
+        # Stelle sicher, dass data[0] ein Array ist, wenn data flach ist
+        # (für Balken und Textanzeige brauchen wir Einzelwerte)
+        values = data if data.ndim == 1 else data[0]
+
+        # Dynamische X-Achsen-Ticks berechnen
+        x_ticks = np.linspace(0, float(values.max()) * 1.1, 6).astype(int)
+
+        # Beschriftung der Balken mit Wert und Prozent
+        # Prozentsätze und Positionen direkt aus den Daten statt pro Balken aus den Artists
+        percentages = values / total * 100 if total > 0 else np.zeros(len(values))
+
+        # Positioniere Text innerhalb oder neben dem Balken
+        x_positions = np.where(values > 0, values * 0.05, 0.1)
+        bar_labels = [f'{absolute_value} \n{percentage:.0f}%'
+                      for absolute_value, percentage in zip(values.tolist(), percentages.tolist())]
+
+        # Vorhandenes Diagramm mit gleichem Layout wiederverwenden - nur bei einem Wert pro
+        # Kategorie; sonst meldet der Neuaufbau den Fehler, ohne die geteilte Figur zu verändern
+        key = (tuple(self.category_names), self.cmap, self.color)
+        template = HorizontalBarChart._template_cache.get(key) if self.reuse_template else None
+        if template is not None and len(values) == num_categories:
+            fig, ax, bars, texts = template
+            ax.set_title(self.title, pad=30)
+            # Achsenbeschriftungen eines vorherigen Aufrufs auf die Standardwerte zurücksetzen
+            ax.set_xlabel('Anzahl', fontsize=matplotlib.rcParams['axes.labelsize'],
+                          fontweight=matplotlib.rcParams['axes.labelweight'])
+            ax.set_ylabel('Kategorien', fontsize=matplotlib.rcParams['axes.labelsize'],
+                          fontweight=matplotlib.rcParams['axes.labelweight'])
+            for rect, text, width, x_position, label in zip(
+                    bars, texts, values.tolist(), x_positions.tolist(), bar_labels):
+                rect.set_width(width)
+                text.set_x(x_position)
+                text.set_text(label)
+            # X-Achse wie beim Neuaufbau an die neuen Balken anpassen, dann Ticks setzen
+            ax.relim()
+            ax.autoscale_view(scaley=False)
+            ax.set_xticks(x_ticks)
+            self.fig = fig
+            return fig, ax
+
+        # Farbkonfiguration - eine Einzelfarbe gilt unverändert für alle Balken
+        category_colors = self._resolve_colors(num_categories, reverse=True, shade=False)
+
+        fig = _new_figure(figsize=(12, 6))
+        ax = fig.add_subplot(111)
+        ax.set_title(self.title, pad=30)
+        
+        # Eine Farbe pro Balken (RGBA-Array) oder eine Einzelfarbe für alle
+        bars = ax.barh(y_pos, values, height=bar_height, label='Results', color=category_colors)
+
+        # Default-Achsenbeschriftungen
+        ax.set_xlabel('Anzahl')
+        ax.set_ylabel('Kategorien')
+        
+        # Y-Achsen-Beschriftung mit Kategorienamen
+        ax.set_yticks(y_pos)
+        ax.set_yticklabels(self.category_names)
+        ax.set_xticks(x_ticks)
+
+        texts = [ax.text(x_position, y, label, va='center', ha='left', fontsize=10, color='black')
+                 for x_position, y, label in zip(x_positions.tolist(), y_pos.tolist(), bar_labels)]
+
+        # Diagramm als Vorlage für weitere Aufrufe mit gleichem Layout merken
+        if self.reuse_template:
+            if len(HorizontalBarChart._template_cache) >= HorizontalBarChart._template_cache_size:
+                HorizontalBarChart._template_cache.pop(next(iter(HorizontalBarChart._template_cache)))
+            HorizontalBarChart._template_cache[key] = (fig, ax, bars, texts)
+
+        self.fig = fig
+        return fig, ax
+
+
+class PieChart(AbstractPlot):
+    """
+    Implementierung eines Kreisdiagramms (Donut-Stil).
+    Zeigt die proportionale Verteilung der Kategorien.
+    """
+    def __init__(self, title, labels, values, filename, color=None, cmap=None):
+        """
+        Initialisiert das Kreisdiagramm mit den übergebenen Parametern.
+        
+        Parameter:
+        ----------
+        title : str
+            Titel des Diagramms
+        labels : list
+            Liste der Kategorienamen
+        values : list
+            Liste der zugehörigen Werte
+        filename : str
+            Name der Ausgabedatei
+        color : str, optional
+            Einzelne Farbe für das Diagramm
+        cmap : str, optional
+            Name einer Matplotlib-Farbpalette
+        """
+        super().__init__(results={'values': values}, category_names=labels, 
+                        title=title, filename=filename, color=color, cmap=cmap)
+        self.labels = labels
+        self.values = values
+
+    def plot(self):
+        """
+        Erstellt ein Kreisdiagramm im Donut-Stil.
+        
+        Returns:
+        --------
+        tuple
+            (fig, ax) Matplotlib-Figur und Achsenobjekt
+        """
+        # Werte einmalig als Array übernehmen, Summe für Prozentberechnung
+        values_arr = np.asarray(self.values)
+        val_sum = values_arr.sum()
+        
+        # Sichere Bestimmung der Anzahl der Labels
+        num_labels = len(self.labels)
+        
+        # Farbkonfiguration - Einzelfarbe mit der gleichen Farbabstufung wie beim BarChart
+        colors = self._resolve_colors(num_labels, reverse=True)
+
+        fig = _new_figure(figsize=(8, 6), dpi=100)
+        ax = fig.add_subplot(1, 1, 1)
+
+        # Leeres Zentrum hinzufügen für Donut-Stil (neue Sequenzen, Originale bleiben unverändert)
+        pie_labels = list(self.labels) + [""]
+        pie_values = np.concatenate((values_arr, [val_sum]))
+        
+        # Füge eine weiße Farbe für das Zentrum hinzu (colors ist immer ein RGBA-Array)
+        colors_with_white = np.vstack((colors, [[1, 1, 1, 1]]))
+
+        # Gerundete Prozentsätze aller Segmente in einem Schritt berechnen
+        percentages = np.rint(values_arr / val_sum * 100).astype(np.int64)
+
+        # Beschriftungen (Wert und Prozentsatz) vorab erzeugen; das mittlere weiße
+        # Segment (zuletzt angehängt) bleibt unbeschriftet. Die Werte kommen aus der
+        # Originalreihe, damit z.B. in [5.5, 4] die 4 nicht als "4.0" erscheint
+        value_list = self.values.tolist() if isinstance(self.values, np.ndarray) else list(self.values)
+        segment_labels = [f"{value} \n{percentage}%"
+                          for value, percentage in zip(value_list, percentages.tolist())]
+        segment_labels.append('')
+        label_iter = iter(segment_labels)
+
+        # Diagramm erstellen - autopct liefert direkt die fertigen Beschriftungen
+        wedges, texts, autotexts = ax.pie(
+            pie_values, labels=None, colors=colors_with_white,
+            wedgeprops={'width': 0.3, 'edgecolor': 'white'},
+            autopct=lambda pct: next(label_iter), startangle=0, pctdistance=0.85,
+            textprops={'color': 'black'}
+        )
+
+        # Weißer Kreis in der Mitte für Donut-Effekt
+        ax.add_artist(Circle((0, 0), 0.6, color='white'))
+        ax.set_aspect('equal')
+        ax.set_ylim(0, 1)
+        ax.set_title(self.title, pad=20)
+        
+        # Labels entfernen, da sie bei Kreisdiagrammen nicht sinnvoll sind
+        ax.set_xticks([])
+        ax.set_yticks([])
+        
+        # Legende hinzufügen, aber ohne das leere Zentrum
+        if len(wedges) > 1:
+            ax.legend(
+                wedges[:len(wedges)-1], 
+                pie_labels[:len(pie_labels)-1], 
+                loc="center"
+            )
+        
+        self.fig = fig
+        return fig, ax
+
+
+if __name__ == "__main__":
+    # Test-Ausführung der Diagrammklassen
+    
+    # Test BarChart
+    bar_chart = BarChart(
+        title="Digitalisierung Unterrichtsmaterialien in Fach 1",
+        category_names=['Vollständig digital', 'Überwiegend digital', 
+                       'Überwiegend analog', 'Vollständig analog'],
+        results={
+            'derzeitiger Stand': [4, 7, 9, 2],
+            'zukünftiger Stand': [7, 7, 6, 2],
+        },
+        filename="bar_chart.png"
+    )
+    bar_chart.plot()
+
+    # Test HorizontalBarChart
+    horizontal_bar_chart = HorizontalBarChart(
+        title="Softwarenutzung in Fach 1",
+        category_names=['CAD Software', 'Chat GPT', 'Citrix', 'MathCAD', 
+                       'Moodle (E-Learning)', 'MS-Office Produkte', 
+                       'MS-Teams', 'Sonstige Software'][::-1],
+        results={"results": [5, 4, 1, 23, 9, 3, 2, 2][::-1]},
+        filename="horizontal_bar_chart.png"
+    )
+    horizontal_bar_chart.plot()
+
+    # Test PieChart
+    pie_chart = PieChart(
+        title="Digitale Tools in Fach 1",
+        labels=["Ja", "Nein"][::-1],
+        values=[21, 9][::-1],
+        filename="pie_chart.png"
+    )
+    pie_chart.plot()
@@ -1,18 +1,136 @@
-import gradio as gr
-import json
-from backend.plot_classes import BarChart, HorizontalBarChart, PieChart
+import asyncio
+import base64
+import hashlib
+import io
+import itertools
+import numpy as np
+import orjson
 import os
-import time
+import threading
 from datetime import datetime, timedelta
+from enum import Enum
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor
 
-def process_data(file):
+# Exportordner im Projekthauptverzeichnis (ein Verzeichnis höher als frontend), einmalig bestimmt
+_EXPORT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "exports")
+
+_DEBOUNCE_SECONDS = 0.3  # Wartezeit nach dem letzten Tastendruck, bevor neu gezeichnet wird
+
+# Farbschema -> (Einzelfarbe, Colormap); nicht aufgeführte Schemata (z.B. "Standard") nutzen die Standardpalette
+_COLOR_MAP = {
+    "Blau": ('#1f77b4', None),
+    "Rot": ('#d62728', None),
+    "Grün": ('#2ca02c', None),
+    "Spektrum": (None, 'viridis'),
+}
+
+def _as_series(values):
+    """
+    Wandelt eine numerische Datenreihe in ein zusammenhängendes, schreibgeschütztes
+    NumPy-Array um. Nicht-numerische, verschachtelte oder gemischte Reihen (z.B. int und
+    float) bleiben unverändert, damit Beschriftungen wie "4" nicht zu "4.0" werden.
+    
+    Parameter:
+    ----------
+    values : list
+        Eine Datenreihe aus der JSON-Datei
+        
+    Returns:
+    --------
+    numpy.ndarray or list
+        Das Array (Datentyp wie in der JSON-Datei, z.B. int64 oder float64) oder die Originalliste
+    """
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        # Ungleich lange, verschachtelte Listen
+        return values
+    if array.ndim != 1 or array.dtype.kind not in 'biuf':
+        return values
+    if len(set(map(type, values))) > 1:
+        # Gemischte Typen würde NumPy zu float64 vereinheitlichen
+        return values
+    array.flags.writeable = False  # wird über den Cache geteilt
+    return array
+
+def _take(values, idx_array):
+    """
+    Wählt die Einträge einer Datenreihe anhand von Indizes aus.
+    
+    Parameter:
+    ----------
+    values : numpy.ndarray or list
+        Die Datenreihe
+    idx_array : numpy.ndarray
+        Die auszuwählenden Indizes
+        
+    Returns:
+    --------
+    numpy.ndarray or list
+        Die ausgewählten Einträge im Typ der Eingabe
+    """
+    if isinstance(values, np.ndarray):
+        return values[idx_array]
+    return np.asarray(values, dtype=object)[idx_array].tolist()
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path, mtime_ns, size, keys):
+    """
+    Parst die JSON-Datei und speichert das Ergebnis zwischen.
+    Änderungszeit und Größe sind Teil des Cache-Schlüssels, damit eine neu
+    hochgeladene oder geänderte Datei automatisch neu eingelesen wird.
+    Das zurückgegebene Dictionary wird von allen Aufrufern geteilt und darf
+    nicht verändert werden. Wird 'results' geladen, wird dessen Struktur
+    (ResultShape) einmalig unter '_shape' mit abgelegt und die numerischen
+    Datenreihen werden als NumPy-Arrays gespeichert.
+    
+    Parameter:
+    ----------
+    path : str
+        Pfad zur JSON-Datei
+    mtime_ns : int
+        Änderungszeit der Datei in Nanosekunden
+    size : int
+        Dateigröße in Bytes
+    keys : tuple
+        Die zu übernehmenden Schlüssel der obersten Ebene
+        
+    Returns:
+    --------
+    dict
+        Die geladenen Daten
+    """
+    # orjson erwartet Bytes, daher binär lesen
+    with open(path, 'rb') as f:
+        document = orjson.loads(f.read())
+    data = {key: document[key] for key in keys if key in document}
+    if 'results' in data:
+        results = data['results']
+        shape = get_result_shape(results)
+        data['_shape'] = shape
+        # Datenreihen einmalig als Arrays ablegen, statt bei jedem Filtern Listen zu durchlaufen
+        if shape is ResultShape.LIST:
+            data['results'] = _as_series(results)
+        elif shape is ResultShape.DICT_RESULTS:
+            data['results'] = {**results, 'results': _as_series(results['results'])}
+        elif shape is ResultShape.DICT_MULTI:
+            data['results'] = {key: _as_series(values) for key, values in results.items()}
+    return data
+
+def process_data(file, keys=('title', 'category_names', 'results', 'filename')):
     """
     Verarbeitet die hochgeladene JSON-Datei und extrahiert die Daten.
+    Es werden nur die benötigten Schlüssel der obersten Ebene übernommen.
+    Wiederholte Aufrufe für dieselbe, unveränderte Datei nutzen den Cache.
     
     Parameter:
     ----------
     file : FileObj
         Die hochgeladene Datei
+    keys : tuple, optional
+        Die zu übernehmenden Schlüssel der obersten Ebene
         
     Returns:
     --------
@@ -21,13 +139,45 @@ def process_data(file):
     """
     if file is None:
         return None, "No file selected"
-    with open(file.name, 'r', encoding="utf-8") as f:
-        data = json.load(f)
-    return data, None
+    st = os.stat(file.name)
+    return _load_json_cached(file.name, st.st_mtime_ns, st.st_size, tuple(keys)), None
+
+class ResultShape(Enum):
+    """
+    Struktur des 'results'-Eintrags der JSON-Daten.
+    """
+    LIST = "list"                  # results = [...]
+    DICT_RESULTS = "dict_results"  # results = {'results': [...]}
+    DICT_MULTI = "dict_multi"      # results = {'key1': [...], 'key2': [...], ...}
+    OTHER = "other"                # keine der bekannten Strukturen
+
+def get_result_shape(results):
+    """
+    Bestimmt einmalig die Struktur der Ergebnisdaten.
+    
+    Parameter:
+    ----------
+    results : list oder dict
+        Der 'results'-Eintrag aus der JSON-Datei
+        
+    Returns:
+    --------
+    ResultShape
+        Die erkannte Datenstruktur
+    """
+    if isinstance(results, (list, np.ndarray)):
+        return ResultShape.LIST
+    if isinstance(results, dict):
+        if isinstance(results.get('results'), (list, np.ndarray)):
+            return ResultShape.DICT_RESULTS
+        if all(isinstance(values, (list, np.ndarray)) for values in results.values()):
+            return ResultShape.DICT_MULTI
+    return ResultShape.OTHER
 
 def is_pie_chart_compatible(data):
     """
     Prüft, ob die Daten für ein Kreisdiagramm geeignet sind.
+    Nur eine einzelne Datenreihe (einfaches Array oder {'results': [...]}) ist geeignet.
     
     Parameter:
     ----------
@@ -39,27 +189,70 @@ def is_pie_chart_compatible(data):
     bool
         True, wenn die Daten für ein Kreisdiagramm geeignet sind, sonst False
     """
-    results = data['results']
+    shape = data.get('_shape') or get_result_shape(data['results'])
+    return shape in (ResultShape.LIST, ResultShape.DICT_RESULTS)
+
+def _memoize_plot(maxsize=16):
+    """
+    Dekorator für plot_data: merkt sich die zuletzt erstellten Figuren (LRU),
+    damit wiederholte Eingaben (z.B. Kategorie ab- und wieder anwählen) kein
+    neues Diagramm erzeugen.
+    Der Schlüssel verwendet id(data), da process_data für eine unveränderte Datei
+    dasselbe Dictionary liefert; zusätzlich wird geprüft, dass es noch dasselbe
+    Objekt ist. Wird ein Figure-Objekt wiederverwendet (BarChart-Vorlage), gehört
+    es danach nur noch zum neuen Schlüssel. Schlägt ein Aufruf fehl, wird der Cache
+    geleert, da der Aufruf eine geteilte Vorlage bereits teilweise verändert haben kann.
+    Aufrufe mit reuse_template=False umgehen den Cache: ihre Figur gehört nur dem Aufrufer.
     
-    # Fall 1: results ist ein einfaches Array - OK für Pie Chart
-    if isinstance(results, list):
-        return True
-        
-    # Fall 2: results ist ein Dict mit genau einem 'results'-Schlüssel - OK für Pie Chart
-    if isinstance(results, dict) and 'results' in results and isinstance(results['results'], list):
-        return True
+    Parameter:
+    ----------
+    maxsize : int
+        Maximale Anzahl gespeicherter Figuren
         
-    # Fall 3: results ist ein Dict mit mehreren Arrays - NICHT geeignet für Pie Chart
-    if isinstance(results, dict) and len(results) > 0:
-        first_key = next(iter(results))
-        if isinstance(results[first_key], list):
-            return False
-    
-    # Im Zweifelsfall annehmen, dass es nicht kompatibel ist
-    return False
+    Returns:
+    --------
+    function
+        Der Dekorator
+    """
+    def decorator(func):
+        cache = OrderedDict()  # Schlüssel: Parameter, Wert: (data, fig)
+
+        @wraps(func)
+        def wrapper(data, plot_type, selected_categories=None, title_text=None,
+                    x_label=None, y_label=None, color_scheme=None, reuse_template=True):
+            if not reuse_template:
+                # Eigene Figur angefordert (z.B. Export): am Cache vorbei
+                return func(data, plot_type, selected_categories, title_text,
+                            x_label, y_label, color_scheme, reuse_template=False)
+
+            key = (id(data), plot_type, tuple(selected_categories or ()),
+                   title_text, x_label, y_label, color_scheme)
+            entry = cache.get(key)
+            if entry is not None and entry[0] is data:
+                cache.move_to_end(key)
+                return entry[1], None
+
+            fig, error_message = func(data, plot_type, selected_categories, title_text,
+                                      x_label, y_label, color_scheme)
+            if error_message:
+                # Nicht bekannt, welche Figur der Fehlschlag berührt hat - keine alten Einträge ausliefern
+                cache.clear()
+                return fig, error_message
+
+            for stale_key in [k for k, (_, cached_fig) in cache.items() if cached_fig is fig]:
+                del cache[stale_key]
+            cache[key] = (data, fig)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            return fig, None
 
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+@_memoize_plot(maxsize=16)
 def plot_data(data, plot_type, selected_categories=None, title_text=None, 
-              x_label=None, y_label=None, color_scheme=None):
+              x_label=None, y_label=None, color_scheme=None, reuse_template=True):
     """
     Erstellt ein Diagramm basierend auf den übergebenen Daten und Parametern.
     
@@ -79,6 +272,9 @@ def plot_data(data, plot_type, selected_categories=None, title_text=None,
         Beschriftung für die Y-Achse
     color_scheme : str, optional
         Ausgewähltes Farbschema ("Standard", "Blau", "Rot", "Grün", "Spektrum")
+    reuse_template : bool, optional
+        Figuren mit gleichem Layout wiederverwenden (Standard). Mit False wird eine
+        eigene, nicht geteilte Figur ohne Plot-Cache und Vorlagen erstellt
         
     Returns:
     --------
@@ -90,30 +286,41 @@ def plot_data(data, plot_type, selected_categories=None, title_text=None,
     category_names = data['category_names']
     results = data['results']
     filename = data.get('filename', 'plot.png')  # Standardwert, falls nicht vorhanden
+    shape = data.get('_shape') or get_result_shape(results)  # beim Laden bestimmt, sonst hier
     
     # Anpassen der Titel-Texte wenn angegeben
     title = title_text if title_text else original_title
     
     # Auswahl der Kategorien - verbesserte Methode für unterschiedliche Datenstrukturen
     if selected_categories and len(selected_categories) > 0:
-        indices = [i for i, cat in enumerate(category_names) if cat in selected_categories]
+        # Index-Tabelle der Kategorien einmalig aufbauen, dann ein Dict-Zugriff pro Auswahl
+        # (die Reihenfolge der Auswahl des Benutzers bleibt dabei erhalten)
+        name_to_idx = {name: i for i, name in enumerate(category_names)}
+        if any(cat not in name_to_idx for cat in selected_categories):
+            # Auswahl ohne exakten Treffer (abweichende Groß-/Kleinschreibung): zusätzlich
+            # einmalig casefold-Schlüssel aufnehmen, exakte Namen haben dabei Vorrang
+            for i, name in enumerate(category_names):
+                name_to_idx.setdefault(str(name).casefold(), i)
+            selected_categories = [cat if cat in name_to_idx else str(cat).casefold()
+                                   for cat in selected_categories]
+        indices = [name_to_idx[cat] for cat in selected_categories if cat in name_to_idx]
+        idx_array = np.asarray(indices, dtype=np.intp)
         filtered_categories = [category_names[i] for i in indices]
         
-        if isinstance(results, dict) and 'results' in results:
+        if shape is ResultShape.DICT_RESULTS:
             # Fall 1: results = {'results': [...]}
-            filtered_results = {'results': [results['results'][i] for i in indices]}
-        elif isinstance(results, list):
+            filtered_results = {'results': _take(results['results'], idx_array)}
+        elif shape is ResultShape.LIST:
             # Fall 2: results = [...]
-            filtered_results = [results[i] for i in indices]
-        elif isinstance(results, dict) and all(isinstance(results[key], list) for key in results):
+            filtered_results = _take(results, idx_array)
+        elif shape is ResultShape.DICT_MULTI:
             # Fall 3: results = {'key1': [...], 'key2': [...], ...}
-            filtered_results = {}
-            for key in results:
-                if len(results[key]) == len(category_names):
-                    filtered_results[key] = [results[key][i] for i in indices]
-                else:
-                    # Wenn die Längen nicht übereinstimmen, das Original behalten
-                    filtered_results[key] = results[key]
+            # Wenn die Längen nicht übereinstimmen, das Original behalten (Reihenfolge der Schlüssel bleibt)
+            num_categories = len(category_names)
+            filtered_results = {
+                key: _take(values, idx_array) if len(values) == num_categories else values
+                for key, values in results.items()
+            }
         else:
             # Fallback wenn nichts anderes passt
             filtered_results = results
@@ -127,78 +334,57 @@ def plot_data(data, plot_type, selected_categories=None, title_text=None,
     # print(f"Filtered Results: {filtered_results}")
 
     # Farbschema-Parameter festlegen
-    color = None
-    cmap = None
-    if color_scheme and color_scheme != "Standard":
-        if (color_scheme == "Blau"):
-            color = '#1f77b4'
-        elif (color_scheme == "Rot"):
-            color = '#d62728'
-        elif (color_scheme == "Grün"):
-            color = '#2ca02c'
-        elif (color_scheme == "Spektrum"):
-            cmap = 'viridis'
+    color, cmap = _COLOR_MAP.get(color_scheme, (None, None))
 
     # # Debug-Ausgabe für Farbparameter
     # print(f"Using color: {color}")
     # print(f"Using cmap: {cmap}")
 
     # Spezielle Prüfung für Pie Chart
-    if plot_type == "Pie Chart" and not is_pie_chart_compatible(data):
+    if plot_type == "Pie Chart" and shape not in (ResultShape.LIST, ResultShape.DICT_RESULTS):
         return None, "Diese Daten sind nicht mit einem Pie Chart kompatibel. Bitte wählen Sie ein anderes Diagramm."
 
-    # Standardisierung des Datenformats - stelle sicher, dass für BarChart ein Dictionary vorliegt
-    if isinstance(filtered_results, list):
-        # Wenn results eine Liste ist, in Dictionary konvertieren
-        if plot_type == "Percented Bar Chart":
-            filtered_results = {'Werte': filtered_results}  # Schlüssel 'Werte' als Dummy-Label
+    # Standardisierung des Datenformats - eine einfache Liste wird einmalig wie {'results': [...]} behandelt
+    if shape is ResultShape.LIST:
+        filtered_results = {'results': filtered_results}
+
+    # Diagrammklassen (und damit matplotlib) erst beim ersten Plot laden
+    from backend.plot_classes import BarChart, HorizontalBarChart, PieChart  # ---> lazy import
 
     try:
         if plot_type == "Percented Bar Chart":
+            # Eine einfache Liste erhält im Balkendiagramm das Label 'Werte'
+            if shape is ResultShape.LIST:
+                filtered_results = {'Werte': filtered_results['results']}
             chart = BarChart(
                 title=title,
                 category_names=filtered_categories,
                 results=filtered_results,
                 filename=filename,
                 color=color,
-                cmap=cmap
+                cmap=cmap,
+                reuse_template=reuse_template
             )
         elif plot_type == "Horizontal Bar Chart":
-            # Umwandlung in das erwartete Format für HorizontalBarChart
-            if isinstance(filtered_results, list):
-                # Erstelle ein Dictionary mit den richtigen Schlüsseln für HorizontalBarChart
-                formatted_results = {'results': filtered_results}
-            else:
-                formatted_results = filtered_results
-                
             chart = HorizontalBarChart(
                 title=title,
                 category_names=filtered_categories,
-                results=formatted_results,
+                results=filtered_results,
                 filename=filename,
                 color=color,
-                cmap=cmap
+                cmap=cmap,
+                reuse_template=reuse_template
             )
         elif plot_type == "Pie Chart":
             try:
-                if isinstance(filtered_results, dict) and 'results' in filtered_results:
-                    chart = PieChart(
-                        title=title,
-                        labels=filtered_categories,
-                        values=filtered_results['results'],
-                        filename=filename,
-                        color=color,
-                        cmap=cmap
-                    )
-                else:
-                    chart = PieChart(
-                        title=title,
-                        labels=filtered_categories,
-                        values=filtered_results,
-                        filename=filename,
-                        color=color,
-                        cmap=cmap
-                    )
+                chart = PieChart(
+                    title=title,
+                    labels=filtered_categories,
+                    values=filtered_results['results'],
+                    filename=filename,
+                    color=color,
+                    cmap=cmap
+                )
             except (KeyError, IndexError, TypeError) as e:
                 return None, f"Pie Chart error: Daten nicht kompatibel. Bitte wählen Sie ein anderes Diagramm. Details: {str(e)}"
         else:
@@ -248,12 +434,11 @@ def save_plot_as_image(fig, format="png", dpi=300, custom_name=None):
         prefix = custom_name or "plot"
         filename = f"{prefix}.{format}"
         
-        # Erstelle den Exportordner im Projekthauptverzeichnis (ein Verzeichnis höher als frontend)
-        export_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "exports")
-        os.makedirs(export_dir, exist_ok=True)
+        # Erstelle den Exportordner, falls er (noch) nicht existiert
+        os.makedirs(_EXPORT_DIR, exist_ok=True)
         
         # Speichere die Datei direkt im Exportordner mit absolutem Pfad
-        export_path = os.path.abspath(os.path.join(export_dir, filename))
+        export_path = os.path.join(_EXPORT_DIR, filename)
         fig.savefig(export_path, format=format, dpi=dpi, bbox_inches="tight")
         
         # Überprüfe, ob die Datei erstellt wurde
@@ -265,9 +450,77 @@ def save_plot_as_image(fig, format="png", dpi=300, custom_name=None):
             return None
     return None
 
+_PARALLEL_DELETE_MIN = 64  # ab dieser Dateianzahl wird parallel gelöscht
+_EXPORT_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.pdf', '.svg'})  # Endungen exportierter Diagramme
+
+def _is_export_file(entry):
+    """
+    Prüft, ob ein Verzeichniseintrag ein exportiertes Diagramm ist.
+    Die Endung wird zuerst geprüft, damit fremde Dateien gar nicht erst
+    untersucht (und nie gelöscht) werden.
+    
+    Parameter:
+    ----------
+    entry : os.DirEntry
+        Eintrag aus os.scandir
+        
+    Returns:
+    --------
+    bool
+        True bei einer regulären Datei mit bekannter Export-Endung
+    """
+    return (os.path.splitext(entry.name)[1].lower() in _EXPORT_EXTS
+            and entry.is_file(follow_symlinks=False))
+
+def _remove_file(path):
+    """
+    Löscht eine einzelne Datei.
+    
+    Parameter:
+    ----------
+    path : str
+        Pfad zur Datei
+        
+    Returns:
+    --------
+    bool
+        True, wenn die Datei gelöscht wurde, sonst False
+    """
+    try:
+        os.remove(path)
+        return True
+    except FileNotFoundError:
+        # Bereits von einem parallelen Aufräumlauf entfernt (wie unlink(missing_ok=True))
+        return False
+    except Exception as e:
+        # Debug, kommt nicht vor wenn Berechtigungen korrekt sind
+        print(f"Fehler beim Löschen von {path}: {str(e)}")
+        return False
+
+def _remove_files(paths):
+    """
+    Löscht die angegebenen Dateien. Bei vielen Dateien werden die blockierenden
+    os.remove-Aufrufe auf mehrere Threads verteilt; für wenige Dateien lohnt
+    sich der Thread-Pool nicht.
+    
+    Parameter:
+    ----------
+    paths : list
+        Pfade der zu löschenden Dateien
+        
+    Returns:
+    --------
+    int
+        Anzahl der gelöschten Dateien
+    """
+    if len(paths) < _PARALLEL_DELETE_MIN:
+        return sum(_remove_file(path) for path in paths)
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        return sum(executor.map(_remove_file, paths))
+
 def clean_export_dir(max_age_days=7):
     """
-    Löscht Dateien im export-Ordner, die älter als max_age_days sind.
+    Löscht exportierte Diagramme im export-Ordner, die älter als max_age_days sind.
     
     Parameter:
     ----------
@@ -279,511 +532,736 @@ def clean_export_dir(max_age_days=7):
     int
         Anzahl der gelöschten Dateien
     """
-    # Exportordner im Projekthauptverzeichnis (ein Verzeichnis höher als frontend)
-    export_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "exports")
-    if not os.path.exists(export_dir):
+    if not os.path.exists(_EXPORT_DIR):
         return 0
     
-    # Aktuelles Datum
+    # Aktuelles Datum - Schwellwert als Zeitstempel, damit pro Datei kein datetime entsteht
     now = datetime.now()
-    threshold_date = now - timedelta(days=max_age_days)
-    deleted_count = 0
-    
-    # Durchsuche alle Dateien im exports-Ordner
-    for filename in os.listdir(export_dir):
-        file_path = os.path.join(export_dir, filename)
-        if os.path.isfile(file_path):
-            # Prüfe das Erstellungsdatum der Datei
-            file_time = datetime.fromtimestamp(os.path.getctime(file_path))
-            if file_time < threshold_date:
-                try:
-                    os.remove(file_path)
-                    deleted_count += 1
-                    # print(f"Alte Datei gelöscht: {file_path}")
-                except Exception as e:
-                    # Debug, kommt nicht vor wenn Berechtigungen korrekt sind
-                    print(f"Fehler beim Löschen von {file_path}: {str(e)}")
-    
-    return deleted_count
+    threshold_ts = (now - timedelta(days=max_age_days)).timestamp()
+    
+    # Durchsuche alle Dateien im exports-Ordner (scandir liefert Dateityp ohne extra stat)
+    with os.scandir(_EXPORT_DIR) as entries:
+        # Prüfe das Erstellungsdatum der Datei
+        old_files = [entry.path for entry in entries
+                     if _is_export_file(entry) and entry.stat().st_ctime < threshold_ts]
+    
+    return _remove_files(old_files)
 
 def delete_all_exports():
     """
-    Löscht alle Dateien im exports-Ordner.
+    Löscht alle exportierten Diagramme im exports-Ordner.
     
     Returns:
     --------
     int
         Anzahl der gelöschten Dateien
     """
-    # Exportordner im Projekthauptverzeichnis (ein Verzeichnis höher als frontend)
-    export_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "exports")
-    if not os.path.exists(export_dir):
+    if not os.path.exists(_EXPORT_DIR):
         return 0
     
-    deleted_count = 0
-    for filename in os.listdir(export_dir):
-        file_path = os.path.join(export_dir, filename)
-        if os.path.isfile(file_path):
-            try:
-                os.remove(file_path)
-                deleted_count += 1
-            except Exception as e:
-                # Debug, kommt nicht vor wenn Berechtigungen korrekt sind
-                print(f"Fehler beim Löschen von {file_path}: {str(e)}")
-    
-    return deleted_count
-
-with gr.Blocks(theme=gr.themes.Base()) as interface:
-    gr.Markdown("# Erweiterte Datenvisualisierung mit Gradio --- Venviro Production ©")
-    gr.Markdown("Laden Sie eine JSON-Datei hoch, wählen Sie die Visualisierungsoptionen und exportieren Sie die Ergebnisse. 📊🚀")
-    
-    with gr.Row():
-        with gr.Column(scale=1):
-            # Datei-Upload und Diagrammtyp
-            file_input = gr.File(label="JSON-Datei hochladen", type="filepath")
-            plot_type = gr.Radio(
-                choices=["Percented Bar Chart", "Horizontal Bar Chart", "Pie Chart"], 
-                label="Diagrammtyp",
-                value="Percented Bar Chart"  # Standardwert
-            )
-            
-            # Kategorie-Auswahl (wird dynamisch befüllt)
-            category_checklist = gr.CheckboxGroup(
-                choices=[], 
-                label="Kategorien auswählen (leer = alle)", 
-                interactive=True
-            )
-            
-            with gr.Accordion("Styling-Optionen", open=False):
-                title_input = gr.Textbox(label="Titel (leer = Standard)")
-                x_label = gr.Textbox(label="X-Achsenbeschriftung")
-                y_label = gr.Textbox(label="Y-Achsenbeschriftung")
-                color_scheme = gr.Radio(
-                    choices=["Standard", "Blau", "Rot", "Grün", "Spektrum"],
-                    label="Farbschema",
-                    value="Standard"
-                )
-            
-            with gr.Accordion("Export-Optionen", open=False):
-                export_format = gr.Radio(
-                    choices=["png", "jpg", "pdf", "svg"],
-                    label="Dateiformat",
-                    value="png"
-                )
-                export_dpi = gr.Slider(
-                    minimum=72, maximum=600, value=300, step=1,
-                    label="Auflösung (DPI)"
-                )
-                
-                # Neues Feld für benutzerdefinierten Dateinamen
-                output_filename = gr.Textbox(
-                    label="Dateiname (ohne Erweiterung, leer = automatisch generieren)",
-                    placeholder="z.B. mein_diagramm"
+    with os.scandir(_EXPORT_DIR) as entries:
+        files = [entry.path for entry in entries if _is_export_file(entry)]
+    
+    return _remove_files(files)
+
+_EXPORT_CACHE = OrderedDict()  # Schlüssel: Exportparameter, Wert: (export_path, filename, identity)
+_EXPORT_CACHE_SIZE = 16
+
+# Exporte laufen parallel: Export-Caches und Schreiben in den exports-Ordner absichern
+_EXPORT_LOCK = threading.Lock()
+
+def _file_identity(path):
+    """
+    Ermittelt die Identität einer Datei (Inode, Größe, Änderungszeit), um zu
+    erkennen, ob sie seit dem Export ersetzt oder überschrieben wurde.
+    
+    Parameter:
+    ----------
+    path : str
+        Pfad zur Datei
+        
+    Returns:
+    --------
+    tuple or None
+        (st_ino, st_size, st_mtime_ns) oder None, wenn die Datei nicht existiert
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+_EXPORT_DIGESTS = OrderedDict()  # Schlüssel: Inhalts-Hash, Wert: (Pfad einer Datei mit diesem Inhalt, identity)
+_EXPORT_DIGESTS_SIZE = 64
+
+def _write_export(export_path, content):
+    """
+    Schreibt eine Exportdatei. Liegt bereits eine Datei mit identischem Inhalt
+    im exports-Ordner (z.B. gleiches Diagramm mit anderem Zeitstempel), wird nur
+    ein Hardlink darauf angelegt statt die Daten erneut zu schreiben. Verlinkt wird
+    nur, solange diese Datei seit dem Schreiben nicht ersetzt wurde.
+    
+    Parameter:
+    ----------
+    export_path : str
+        Zielpfad der Datei
+    content : bytes
+        Der Dateiinhalt
+    """
+    digest = hashlib.blake2b(content, digest_size=16).digest()
+    
+    # Eine vorhandene Datei unter dem Zielnamen zuerst entfernen, damit ein
+    # Hardlink-Partner beim Überschreiben nicht mitverändert wird
+    if os.path.lexists(export_path):
+        os.remove(export_path)
+        # Einträge, die auf die entfernte Datei zeigen, gelten nicht mehr
+        for stale_digest in [d for d, (path, _) in _EXPORT_DIGESTS.items() if path == export_path]:
+            del _EXPORT_DIGESTS[stale_digest]
+    
+    existing = _EXPORT_DIGESTS.get(digest)
+    if existing is not None and _file_identity(existing[0]) == existing[1]:
+        try:
+            os.link(existing[0], export_path)
+            _EXPORT_DIGESTS.move_to_end(digest)
+            return
+        except OSError:
+            pass  # z.B. Dateisystem ohne Hardlinks: normal schreiben
+    
+    with open(export_path, 'wb') as f:
+        f.write(content)
+    _EXPORT_DIGESTS[digest] = (export_path, _file_identity(export_path))
+    if len(_EXPORT_DIGESTS) > _EXPORT_DIGESTS_SIZE:
+        _EXPORT_DIGESTS.popitem(last=False)
+
+def _build_export(file, plot_type, selected_categories, title_text, x_label, y_label, color_scheme,
+                  export_format, export_dpi, output_filename, add_timestamp):
+    """
+    Erstellt das Diagramm und speichert es im exports-Ordner.
+    Gemeinsame Logik von export_plot und export_for_download. Gezeichnet wird auf
+    einer eigenen Figur (ohne Plot-Cache und Vorlagen), damit Exporte parallel zur
+    Vorschau laufen können. Ein identischer
+    Export derselben, unveränderten Datei wird nicht erneut gerendert, solange
+    die zuvor erzeugte Datei unverändert im exports-Ordner liegt (nicht etwa von
+    einem anderen Export mit gleichem Dateinamen überschrieben wurde).
+    
+    Parameter:
+    ----------
+    Entsprechen denen von export_plot bzw. export_for_download.
+        
+    Returns:
+    --------
+    tuple
+        (export_path, filename, error_message) - Pfad und Dateiname des Exports oder eine Fehlermeldung
+    """
+    st = os.stat(file.name)
+    key = (file.name, st.st_mtime_ns, plot_type, tuple(selected_categories or ()), title_text,
+           x_label, y_label, color_scheme, export_format, export_dpi, output_filename, add_timestamp)
+    with _EXPORT_LOCK:
+        cached = _EXPORT_CACHE.get(key)
+        if cached is not None and _file_identity(cached[0]) == cached[2]:
+            _EXPORT_CACHE.move_to_end(key)
+            return cached[0], cached[1], None
+    
+    data, error_message = process_data(file)
+    if error_message:
+        return None, None, error_message
+    
+    # Unmemoisiert und ohne Vorlage: die Figur gehört nur diesem Export
+    fig, error_message = plot_data(
+        data, plot_type, selected_categories, title_text, x_label, y_label, color_scheme,
+        reuse_template=False
+    )
+    
+    if error_message:
+        return None, None, error_message
+    
+    # Dateinamen für den Export bestimmen
+    timestamp = f"{datetime.now():%Y%m%d_%H%M%S}" if add_timestamp else ""
+    
+    # Wenn kein benutzerdefinierter Name angegeben wird, verwende den Basisnamen aus dem Original
+    if not output_filename:
+        original_filename = data.get('filename', 'plot')
+        base_name = os.path.splitext(original_filename)[0]
+    else:
+        base_name = output_filename
+        
+    # Timestamp hinzufügen, wenn aktiviert
+    if timestamp:
+        filename = f"{base_name}_{timestamp}.{export_format}"
+    else:
+        filename = f"{base_name}.{export_format}"
+    
+    # Erstelle den Export-Pfad
+    os.makedirs(_EXPORT_DIR, exist_ok=True)
+    export_path = os.path.join(_EXPORT_DIR, filename)
+    
+    # Speichere die Figur (volle Standardkompression, die Datei wird aufbewahrt)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=export_format, dpi=export_dpi, bbox_inches="tight")
+    
+    with _EXPORT_LOCK:
+        _write_export(export_path, buffer.getvalue())
+        
+        identity = _file_identity(export_path)
+        if identity is None:
+            return None, None, "Export fehlgeschlagen"
+        
+        _EXPORT_CACHE[key] = (export_path, filename, identity)
+        if len(_EXPORT_CACHE) > _EXPORT_CACHE_SIZE:
+            _EXPORT_CACHE.popitem(last=False)
+    return export_path, filename, None
+
+_PREVIEW_CACHE = OrderedDict()  # Schlüssel: Plotparameter, Wert: kodierte Vorschau
+_PREVIEW_CACHE_SIZE = 64
+
+def _build_preview(file, plot_type, selected_categories, title_text, x_label, y_label, color_scheme, encode):
+    """
+    Erstellt die kodierte Vorschau des Diagramms für die Weboberfläche.
+    Bereits kodierte Vorschauen derselben, unveränderten Datei werden direkt
+    zurückgegeben, ohne das Diagramm erneut zu zeichnen und zu kodieren.
+    
+    Parameter:
+    ----------
+    Entsprechen denen von plot_data, zusätzlich:
+    encode : callable
+        Wandelt die Figur in die Darstellung der Plot-Komponente um
+        
+    Returns:
+    --------
+    tuple
+        (preview, error_message) - Die kodierte Vorschau oder eine Fehlermeldung
+    """
+    st = os.stat(file.name)
+    key = (file.name, st.st_mtime_ns, plot_type, tuple(selected_categories or ()), title_text,
+           x_label, y_label, color_scheme)
+    preview = _PREVIEW_CACHE.get(key)
+    if preview is not None:
+        _PREVIEW_CACHE.move_to_end(key)
+        return preview, None
+    
+    data, error_message = process_data(file)
+    if error_message:
+        return None, error_message
+    
+    fig, error_message = plot_data(
+        data, plot_type, selected_categories, title_text, x_label, y_label, color_scheme
+    )
+    if error_message:
+        return None, error_message
+    
+    # Kodieren, solange die (evtl. wiederverwendete) Figur noch diesen Stand zeigt
+    preview = encode(fig)
+    _PREVIEW_CACHE[key] = preview
+    if len(_PREVIEW_CACHE) > _PREVIEW_CACHE_SIZE:
+        _PREVIEW_CACHE.popitem(last=False)
+    return preview, None
+
+def _warmup():
+    """
+    Lädt matplotlib und die Diagrammklassen vorab und rendert ein kleines Diagramm,
+    damit Schriftarten-Cache, Agg-Renderer und PNG-Encoder beim ersten echten
+    Diagramm bereits initialisiert sind.
+    """
+    from backend.plot_classes import PieChart  # ---> lazy import
+    fig, _ = PieChart(title="Warmup", labels=["A", "B"], values=[1, 1], filename="warmup").plot()
+    fig.savefig(io.BytesIO(), format="png", pil_kwargs={"compress_level": 1})
+
+def build_interface():
+    """
+    Erstellt die Gradio-Oberfläche mit allen Event-Handlern.
+    Gradio wird erst hier importiert, damit die Datenfunktionen dieses Moduls
+    ohne den Import der Weboberfläche genutzt werden können.
+    
+    Returns:
+    --------
+    gr.Blocks
+        Die fertig aufgebaute Oberfläche (Start mit launch())
+    """
+    import gradio as gr  # ---> lazy import
+    from gradio.components.plot import PlotData
+    
+    with gr.Blocks(theme=gr.themes.Base()) as interface:
+        gr.Markdown("# Erweiterte Datenvisualisierung mit Gradio --- Venviro Production ©")
+        gr.Markdown("Laden Sie eine JSON-Datei hoch, wählen Sie die Visualisierungsoptionen und exportieren Sie die Ergebnisse. 📊🚀")
+        
+        with gr.Row():
+            with gr.Column(scale=1):
+                # Datei-Upload und Diagrammtyp
+                file_input = gr.File(label="JSON-Datei hochladen", type="filepath")
+                plot_type = gr.Radio(
+                    choices=["Percented Bar Chart", "Horizontal Bar Chart", "Pie Chart"], 
+                    label="Diagrammtyp",
+                    value="Percented Bar Chart"  # Standardwert
                 )
                 
-                # Checkbox für Timestamp hinzufügen
-                add_timestamp = gr.Checkbox(
-                    label="Zeitstempel zum Dateinamen hinzufügen",
-                    value=True
+                # Kategorie-Auswahl (wird dynamisch befüllt)
+                category_checklist = gr.CheckboxGroup(
+                    choices=[], 
+                    label="Kategorien auswählen (leer = alle)", 
+                    interactive=True
                 )
                 
-                # Zwei Export-Buttons statt einem
-                gr.Row([
-                    export_button := gr.Button("In Ordner exportieren", variant="primary"),
-                    download_button := gr.Button("Als Datei herunterladen", variant="secondary")
-                ])
-                
-                export_info = gr.Markdown("""
-                **Hinweis zum Export:**
-                - "In Ordner exportieren" speichert die Datei lokal im 'exports' Ordner
-                - "Als Datei herunterladen" ermöglicht den direkten Download im Browser
-                """)
+                with gr.Accordion("Styling-Optionen", open=False):
+                    title_input = gr.Textbox(label="Titel (leer = Standard)")
+                    x_label = gr.Textbox(label="X-Achsenbeschriftung")
+                    y_label = gr.Textbox(label="Y-Achsenbeschriftung")
+                    color_scheme = gr.Radio(
+                        choices=["Standard", "Blau", "Rot", "Grün", "Spektrum"],
+                        label="Farbschema",
+                        value="Standard"
+                    )
                 
-                # Füge Funktionen zur Reinigung des export-Ordners hinzu
-                gr.Markdown("### Export-Ordner verwalten")
+                with gr.Accordion("Export-Optionen", open=False):
+                    export_format = gr.Radio(
+                        choices=["png", "jpg", "pdf", "svg"],
+                        label="Dateiformat",
+                        value="png"
+                    )
+                    export_dpi = gr.Slider(
+                        minimum=72, maximum=600, value=300, step=1,
+                        label="Auflösung (DPI)"
+                    )
+                    
+                    # Neues Feld für benutzerdefinierten Dateinamen
+                    output_filename = gr.Textbox(
+                        label="Dateiname (ohne Erweiterung, leer = automatisch generieren)",
+                        placeholder="z.B. mein_diagramm"
+                    )
+                    
+                    # Checkbox für Timestamp hinzufügen
+                    add_timestamp = gr.Checkbox(
+                        label="Zeitstempel zum Dateinamen hinzufügen",
+                        value=True
+                    )
+                    
+                    # Zwei Export-Buttons statt einem
+                    gr.Row([
+                        export_button := gr.Button("In Ordner exportieren", variant="primary"),
+                        download_button := gr.Button("Als Datei herunterladen", variant="secondary")
+                    ])
+                    
+                    export_info = gr.Markdown("""
+                    **Hinweis zum Export:**
+                    - "In Ordner exportieren" speichert die Datei lokal im 'exports' Ordner
+                    - "Als Datei herunterladen" ermöglicht den direkten Download im Browser
+                    """)
+                    
+                    # Füge Funktionen zur Reinigung des export-Ordners hinzu
+                    gr.Markdown("### Export-Ordner verwalten")
+                    
+                    with gr.Row():
+                        cleanup_button = gr.Button("Alte Exports löschen (>7 Tage)", variant="secondary")
+                        delete_all_button = gr.Button("Alle Exports löschen", variant="stop")
+                    
+                    cleanup_info = gr.Markdown(visible=False)
+            
+            with gr.Column(scale=2):
+                # Ausgabe
+                output_plot = gr.Plot(label="Visualisierung")
+                message = gr.Markdown(visible=True)  # Immer sichtbar, um Platz zu reservieren
                 
-                with gr.Row():
-                    cleanup_button = gr.Button("Alte Exports löschen (>7 Tage)", variant="secondary")
-                    delete_all_button = gr.Button("Alle Exports löschen", variant="stop")
+                # Entferne den problematischen Download-Button und ersetze ihn durch einen Hinweis
+                export_success_info = gr.Markdown(visible=False)
                 
-                cleanup_info = gr.Markdown(visible=False)
-        
-        with gr.Column(scale=2):
-            # Ausgabe
-            output_plot = gr.Plot(label="Visualisierung")
-            message = gr.Markdown(visible=True)  # Immer sichtbar, um Platz zu reservieren
-            
-            # Entferne den problematischen Download-Button und ersetze ihn durch einen Hinweis
-            export_success_info = gr.Markdown(visible=False)
-            
-            # Download-Output für direkten Download
-            download_output = gr.File(label="⬇️ HIER KLICKEN ZUM HERUNTERLADEN", visible=False)
+                # Download-Output für direkten Download
+                download_output = gr.File(label="⬇️ HIER KLICKEN ZUM HERUNTERLADEN", visible=False)
 
-    def load_categories(file):
-        """
-        Lädt die Kategorien aus der JSON-Datei und aktualisiert die Auswahlbox.
-        
-        Parameter:
-        ----------
-        file : FileObj
-            Die hochgeladene Datei
+        def load_categories(file):
+            """
+            Lädt die Kategorien aus der JSON-Datei und aktualisiert die Auswahlbox.
             
-        Returns:
-        --------
-        gr.update
-            Update-Objekt für die Kategorie-Auswahl mit den geladenen Optionen
-        """
-        if file is None:
-            # Keine Datei vorhanden - zurücksetzen der Kategorien und unsichtbar machen
-            return gr.update(choices=[], value=[], visible=False)
-        
-        try:
-            data, error = process_data(file)
-            if error:
+            Parameter:
+            ----------
+            file : FileObj
+                Die hochgeladene Datei
+                
+            Returns:
+            --------
+            gr.update
+                Update-Objekt für die Kategorie-Auswahl mit den geladenen Optionen
+            """
+            if file is None:
+                # Keine Datei vorhanden - zurücksetzen der Kategorien und unsichtbar machen
                 return gr.update(choices=[], value=[], visible=False)
             
-            category_names = data['category_names']
-            # Sofort den Plot mit allen Kategorien erstellen
-            return gr.update(choices=category_names, value=[], visible=True)
-        except Exception as e:
-            # print(f"Fehler beim Laden der Kategorien: {str(e)}")
-            return gr.update(choices=[], value=[], visible=False)
-    
-    def update_plot(file, plot_type, selected_categories, title_text, x_label, y_label, color_scheme):
-        """
-        Aktualisiert das Diagramm basierend auf den ausgewählten Parametern.
-        
-        Parameter:
-        ----------
-        file : FileObj
-            Die hochgeladene Datei
-        plot_type : str
-            Der gewählte Diagrammtyp
-        selected_categories : list
-            Die ausgewählten Kategorien
-        title_text : str
-            Benutzerdefinierter Titel
-        x_label : str
-            X-Achsenbeschriftung
-        y_label : str
-            Y-Achsenbeschriftung
-        color_scheme : str
-            Ausgewähltes Farbschema
-            
-        Returns:
-        --------
-        tuple
-            (fig, message_update, download_update) - Die Figur und UI-Updates
-        """
-        if file is None:
-            # Wenn keine Datei ausgewählt ist, Plots und Downloads zurücksetzen
-            return None, gr.update(value="**Info:** Bitte eine JSON-Datei hochladen", visible=True), None
+            try:
+                data, error = process_data(file)
+                if error:
+                    return gr.update(choices=[], value=[], visible=False)
+                
+                category_names = data['category_names']
+                # Sofort den Plot mit allen Kategorien erstellen
+                return gr.update(choices=category_names, value=[], visible=True)
+            except Exception as e:
+                # print(f"Fehler beim Laden der Kategorien: {str(e)}")
+                return gr.update(choices=[], value=[], visible=False)
         
-        try:
-            data, error_message = process_data(file)
-            if error_message:
-                return None, gr.update(value=f"**Error:** {error_message}", visible=True), None
-            
-            fig, error_message = plot_data(
-                data, plot_type, selected_categories, title_text, x_label, y_label, color_scheme
-            )
+        def encode_preview(fig):
+            """
+            Kodiert die Figur für die Plot-Komponente als PNG mit schneller zlib-Stufe 1.
+            Die Vorschau wird sofort angezeigt und nicht gespeichert, daher lohnt sich
+            die stärkere Kompression (oder das langsamere WebP von gr.Plot) nicht.
             
-            if error_message:
-                return None, gr.update(value=f"**Error:** {error_message}", visible=True), None
+            Parameter:
+            ----------
+            fig : matplotlib.figure.Figure
+                Die zu kodierende Figur
+                
+            Returns:
+            --------
+            PlotData
+                Die Vorschau im Format der Plot-Komponente
+            """
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format="png", pil_kwargs={"compress_level": 1})
+            encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
+            return PlotData(type="matplotlib", plot=f"data:image/png;base64,{encoded}")
+        
+        def update_plot(file, plot_type, selected_categories, title_text, x_label, y_label, color_scheme, last_digest=None):
+            """
+            Aktualisiert das Diagramm basierend auf den ausgewählten Parametern.
             
-            return fig, gr.update(value="Plot erfolgreich generiert!", visible=True), None
-        except Exception as e:
-            return None, gr.update(value=f"**Error:** {str(e)}", visible=True), None
-    
-    def export_plot(file, plot_type, selected_categories, title_text, x_label, y_label, color_scheme, export_format, export_dpi, output_filename, add_timestamp):
-        """
-        Exportiert das Diagramm im gewünschten Format in den exports-Ordner.
-        
-        Parameter:
-        ----------
-        file : FileObj
-            Die hochgeladene Datei
-        plot_type : str
-            Der gewählte Diagrammtyp
-        selected_categories : list
-            Die ausgewählten Kategorien
-        title_text : str
-            Benutzerdefinierter Titel
-        x_label : str
-            X-Achsenbeschriftung
-        y_label : str
-            Y-Achsenbeschriftung
-        color_scheme : str
-            Ausgewähltes Farbschema
-        export_format : str
-            Das gewünschte Dateiformat (png, jpg, pdf, svg)
-        export_dpi : int
-            Die Auflösung in DPI
-        output_filename : str
-            Der benutzerdefinierte Dateiname
-        add_timestamp : bool
-            Flag zum Hinzufügen eines Zeitstempels zum Dateinamen
+            Parameter:
+            ----------
+            file : FileObj
+                Die hochgeladene Datei
+            plot_type : str
+                Der gewählte Diagrammtyp
+            selected_categories : list
+                Die ausgewählten Kategorien
+            title_text : str
+                Benutzerdefinierter Titel
+            x_label : str
+                X-Achsenbeschriftung
+            y_label : str
+                Y-Achsenbeschriftung
+            color_scheme : str
+                Ausgewähltes Farbschema
+            last_digest : bytes or None
+                Prüfsumme der zuletzt an diese Sitzung gesendeten Vorschau
+                
+            Returns:
+            --------
+            tuple
+                (plot_update, message_update, digest) - Vorschau (oder gr.skip(), wenn sie
+                sich nicht geändert hat), Meldung und Prüfsumme der angezeigten Vorschau
+            """
+            if file is None:
+                # Wenn keine Datei ausgewählt ist, Plots zurücksetzen
+                return None, gr.update(value="**Info:** Bitte eine JSON-Datei hochladen", visible=True), None
             
-        Returns:
-        --------
-        gr.update
-            Update-Objekt für die Erfolgs-/Fehlermeldung
-        """
-        if file is None:
-            return gr.update(value="**⚠️ Fehler:** Keine Datei ausgewählt", visible=True)
+            try:
+                preview, error_message = _build_preview(
+                    file, plot_type, selected_categories, title_text, x_label, y_label, color_scheme,
+                    encode=encode_preview
+                )
+                
+                if error_message:
+                    return None, gr.update(value=f"**Error:** {error_message}", visible=True), None
+                
+                # Identisches Bild nicht erneut übertragen - der Browser zeigt es bereits an
+                digest = hashlib.blake2b(preview.plot.encode(), digest_size=16).digest()
+                plot_update = gr.skip() if digest == last_digest else preview
+                return plot_update, gr.update(value="Plot erfolgreich generiert!", visible=True), digest
+            except Exception as e:
+                return None, gr.update(value=f"**Error:** {str(e)}", visible=True), None
         
-        try:
-            data, error_message = process_data(file)
-            if error_message:
-                return gr.update(value=f"**⚠️ Fehler:** {error_message}", visible=True)
-            
-            fig, error_message = plot_data(
-                data, plot_type, selected_categories, title_text, x_label, y_label, color_scheme
-            )
+        # Nummer des jeweils letzten Text-Events pro Sitzung (für das Debouncing)
+        latest_text_event = {}
+        # Beginnt bei 1: render_tick startet mit 0, sonst löst die erste Marke keine Änderung aus
+        text_event_counter = itertools.count(1)
+        
+        async def debounce_text_input(request: gr.Request):
+            """
+            Entprellt Texteingaben: Erst wenn für _DEBOUNCE_SECONDS keine weitere
+            Texteingabe derselben Sitzung erfolgt ist, wird eine neue Render-Marke
+            ausgegeben. Überholte Events werden übersprungen. Gezeichnet wird über die
+            Änderung der Render-Marke, also in derselben Warteschlange wie alle anderen
+            Diagramm-Events.
             
-            if error_message:
-                return gr.update(value=f"**⚠️ Fehler:** {error_message}", visible=True)
+            Parameter:
+            ----------
+            request : gr.Request
+                Die Anfrage (liefert die Sitzungs-ID)
+                
+            Returns:
+            --------
+            int or gr.skip
+                Neue Render-Marke oder gr.skip() für überholte Events
+            """
+            session = request.session_hash
+            event_id = next(text_event_counter)
+            latest_text_event[session] = event_id
             
-            # Dateinamen für den Export bestimmen
-            timestamp = time.strftime("%Y%m%d_%H%M%S") if add_timestamp else ""
+            await asyncio.sleep(_DEBOUNCE_SECONDS)
+            if latest_text_event.get(session) != event_id:
+                return gr.skip()
+            del latest_text_event[session]
+            return event_id
+        
+        def export_plot(file, plot_type, selected_categories, title_text, x_label, y_label, color_scheme, export_format, export_dpi, output_filename, add_timestamp):
+            """
+            Exportiert das Diagramm im gewünschten Format in den exports-Ordner.
             
-            # Wenn kein benutzerdefinierter Name angegeben wird, verwende den Basisnamen aus dem Original
-            if not output_filename:
-                original_filename = data.get('filename', 'plot')
-                base_name = os.path.splitext(original_filename)[0]
-            else:
-                base_name = output_filename
+            Parameter:
+            ----------
+            file : FileObj
+                Die hochgeladene Datei
+            plot_type : str
+                Der gewählte Diagrammtyp
+            selected_categories : list
+                Die ausgewählten Kategorien
+            title_text : str
+                Benutzerdefinierter Titel
+            x_label : str
+                X-Achsenbeschriftung
+            y_label : str
+                Y-Achsenbeschriftung
+            color_scheme : str
+                Ausgewähltes Farbschema
+            export_format : str
+                Das gewünschte Dateiformat (png, jpg, pdf, svg)
+            export_dpi : int
+                Die Auflösung in DPI
+            output_filename : str
+                Der benutzerdefinierte Dateiname
+            add_timestamp : bool
+                Flag zum Hinzufügen eines Zeitstempels zum Dateinamen
                 
-            # Timestamp hinzufügen, wenn aktiviert
-            if timestamp:
-                filename = f"{base_name}_{timestamp}.{export_format}"
-            else:
-                filename = f"{base_name}.{export_format}"
+            Returns:
+            --------
+            gr.update
+                Update-Objekt für die Erfolgs-/Fehlermeldung
+            """
+            if file is None:
+                return gr.update(value="**⚠️ Fehler:** Keine Datei ausgewählt", visible=True)
             
-            # Erstelle den Export-Pfad
-            export_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "exports")
-            os.makedirs(export_dir, exist_ok=True)
-            export_path = os.path.join(export_dir, filename)
+            try:
+                export_path, filename, error_message = _build_export(
+                    file, plot_type, selected_categories, title_text, x_label, y_label, color_scheme,
+                    export_format, export_dpi, output_filename, add_timestamp
+                )
+                
+                if error_message:
+                    return gr.update(value=f"**⚠️ Fehler:** {error_message}", visible=True)
+                
+                return gr.update(
+                    value=f"""
+                        **✅ Export erfolgreich!**
+                        
+                        Die Datei wurde gespeichert als: 
+                        **{filename}**
+                        
+                        Vollständiger Pfad:
+                        `{export_path}`
+                        
+                        Sie finden alle exportierten Dateien im Ordner 'exports'.
+                        """, 
+                    visible=True
+                )
+            except Exception as e:
+                # import traceback # ---> lazy import
+                # traceback.print_exc()
+                return gr.update(value=f"**⚠️ Fehler:** {str(e)}", visible=True)
+        
+        def export_for_download(file, plot_type, selected_categories, title_text, x_label, y_label, color_scheme, export_format, export_dpi, output_filename, add_timestamp):
+            """
+            Exportiert das Diagramm für den direkten Download im Browser.
             
-            # Speichere die Figur
-            fig.savefig(export_path, format=export_format, dpi=export_dpi, bbox_inches="tight")
+            Parameter:
+            ----------
+            file : FileObj
+                Die hochgeladene Datei
+            plot_type : str
+                Der gewählte Diagrammtyp
+            selected_categories : list
+                Die ausgewählten Kategorien
+            title_text : str
+                Benutzerdefinierter Titel
+            x_label : str
+                X-Achsenbeschriftung
+            y_label : str
+                Y-Achsenbeschriftung
+            color_scheme : str
+                Ausgewähltes Farbschema
+            export_format : str
+                Das gewünschte Dateiformat (png, jpg, pdf, svg)
+            export_dpi : int
+                Die Auflösung in DPI
+            output_filename : str
+                Der benutzerdefinierte Dateiname
+            add_timestamp : bool
+                Flag zum Hinzufügen eines Zeitstempels zum Dateinamen
+                
+            Returns:
+            --------
+            tuple
+                (download_update, message_update) - Update-Objekte für den Download und die Nachricht
+            """
+            if file is None:
+                return None, gr.update(value="**⚠️ Fehler:** Keine Datei ausgewählt", visible=True)
             
-            if os.path.exists(export_path):
-                return gr.update(
+            try:
+                export_path, filename, error_message = _build_export(
+                    file, plot_type, selected_categories, title_text, x_label, y_label, color_scheme,
+                    export_format, export_dpi, output_filename, add_timestamp
+                )
+                
+                if error_message:
+                    return None, gr.update(value=f"**⚠️ Fehler:** {error_message}", visible=True)
+                
+                # Rückgabe für Download
+                return gr.update(value=export_path, visible=True), gr.update(
                     value=f"""
-                    **✅ Export erfolgreich!**
-                    
-                    Die Datei wurde gespeichert als: 
-                    **{filename}**
+                    **✅ Download bereit!**
                     
-                    Vollständiger Pfad:
-                    `{export_path}`
+                    Die Datei wurde als **{filename}** gespeichert und ist zum Download bereit.
+                    Sie finden die Datei auch direkt im 'exports'-Ordner.
                     
-                    Sie finden alle exportierten Dateien im Ordner 'exports'.
+                    Klicken Sie auf den Dateinamen unten zum Herunterladen.
                     """, 
                     visible=True
                 )
-            else:
-                return gr.update(value="**⚠️ Fehler:** Export fehlgeschlagen", visible=True)
-        except Exception as e:
-            # import traceback # ---> lazy import
-            # traceback.print_exc()
-            return gr.update(value=f"**⚠️ Fehler:** {str(e)}", visible=True)
-    
-    def export_for_download(file, plot_type, selected_categories, title_text, x_label, y_label, color_scheme, export_format, export_dpi, output_filename, add_timestamp):
-        """
-        Exportiert das Diagramm für den direkten Download im Browser.
-        
-        Parameter:
-        ----------
-        file : FileObj
-            Die hochgeladene Datei
-        plot_type : str
-            Der gewählte Diagrammtyp
-        selected_categories : list
-            Die ausgewählten Kategorien
-        title_text : str
-            Benutzerdefinierter Titel
-        x_label : str
-            X-Achsenbeschriftung
-        y_label : str
-            Y-Achsenbeschriftung
-        color_scheme : str
-            Ausgewähltes Farbschema
-        export_format : str
-            Das gewünschte Dateiformat (png, jpg, pdf, svg)
-        export_dpi : int
-            Die Auflösung in DPI
-        output_filename : str
-            Der benutzerdefinierte Dateiname
-        add_timestamp : bool
-            Flag zum Hinzufügen eines Zeitstempels zum Dateinamen
+                    
+            except Exception as e:
+                # import traceback
+                # traceback.print_exc()
+                return None, gr.update(value=f"**⚠️ Fehler:** {str(e)}", visible=True)
+
+        def cleanup_exports():
+            """
+            Löscht alte Export-Dateien, die älter als 7 Tage sind.
             
-        Returns:
-        --------
-        tuple
-            (download_update, message_update) - Update-Objekte für den Download und die Nachricht
-        """
-        if file is None:
-            return None, gr.update(value="**⚠️ Fehler:** Keine Datei ausgewählt", visible=True)
+            Returns:
+            --------
+            gr.update
+                Update-Objekt für die Statusmeldung mit Anzahl der gelöschten Dateien
+            """
+            deleted = clean_export_dir(max_age_days=7)
+            if deleted > 0:
+                return gr.update(value=f"**✅ Aufgeräumt!** {deleted} alte Dateien wurden gelöscht.", visible=True)
+            else:
+                return gr.update(value="**ℹ️ Info:** Es wurden keine alten Dateien gefunden.", visible=True)
         
-        try:
-            data, error_message = process_data(file)
-            if error_message:
-                return None, gr.update(value=f"**⚠️ Fehler:** {error_message}", visible=True)
+        def clear_exports():
+            """
+            Löscht alle Dateien im Export-Ordner sofort.
             
-            fig, error_message = plot_data(
-                data, plot_type, selected_categories, title_text, x_label, y_label, color_scheme
-            )
-            
-            if error_message:
-                return None, gr.update(value=f"**⚠️ Fehler:** {error_message}", visible=True)
-            
-            # Dateinamen für den Export bestimmen
-            timestamp = time.strftime("%Y%m%d_%H%M%S") if add_timestamp else ""
-            
-            # Wenn kein benutzerdefinierter Name angegeben wird, verwende den Basisnamen aus dem Original
-            if not output_filename:
-                original_filename = data.get('filename', 'plot')
-                base_name = os.path.splitext(original_filename)[0]
+            Returns:
+            --------
+            gr.update
+                Update-Objekt für die Statusmeldung mit Anzahl der gelöschten Dateien
+            """
+            deleted = delete_all_exports()
+            if deleted > 0:
+                return gr.update(value=f"**✅ Erledigt!** Alle {deleted} Dateien wurden aus dem Export-Ordner gelöscht.", visible=True)
             else:
-                base_name = output_filename
-                
-            # Timestamp hinzufügen, wenn aktiviert
-            if timestamp:
-                filename = f"{base_name}_{timestamp}.{export_format}"
-            else:
-                filename = f"{base_name}.{export_format}"
-            
-            # Erstelle den Export-Pfad
-            export_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "exports")
-            os.makedirs(export_dir, exist_ok=True)
-            export_path = os.path.join(export_dir, filename)
-            
-            # Speichere die Figur
-            fig.savefig(export_path, format=export_format, dpi=export_dpi, bbox_inches="tight")
-            
-            #! Wichtig: wir nehmen an, dass die Datei erfolgreich gespeichert wurde
-            # print(f"Download-Datei erstellt in: {export_path}")
-            
-            # Rückgabe für Download
-            return gr.update(value=export_path, visible=True), gr.update(
-                value=f"""
-                **✅ Download bereit!**
-                
-                Die Datei wurde als **{filename}** gespeichert und ist zum Download bereit.
-                Sie finden die Datei auch direkt im 'exports'-Ordner.
-                
-                Klicken Sie auf den Dateinamen unten zum Herunterladen.
-                """, 
+                return gr.update(value="**ℹ️ Info:** Der Export-Ordner ist bereits leer.", visible=True)
+
+        # Event-Handler
+        file_input.change(
+            fn=load_categories,
+            inputs=[file_input],
+            outputs=[category_checklist]
+        )
+        
+        # Entferne den automatischen Plot-Generator beim Datei-Upload
+        # und ersetze ihn durch eine einfache Willkommensnachricht
+        def show_welcome_message(file):
+            """Zeigt eine Willkommensnachricht nach dem Datei-Upload an"""
+            if file is None:
+                return gr.update(value="**Info:** Bitte eine JSON-Datei hochladen", visible=True)
+            return gr.update(
+                value="**✅ Datei geladen!** Bitte wählen Sie einen Diagrammtyp oder passen Sie die Parameter an.", 
                 visible=True
             )
-                
-        except Exception as e:
-            # import traceback
-            # traceback.print_exc()
-            return None, gr.update(value=f"**⚠️ Fehler:** {str(e)}", visible=True)
-
-    def cleanup_exports():
-        """
-        Löscht alte Export-Dateien, die älter als 7 Tage sind.
-        
-        Returns:
-        --------
-        gr.update
-            Update-Objekt für die Statusmeldung mit Anzahl der gelöschten Dateien
-        """
-        deleted = clean_export_dir(max_age_days=7)
-        if deleted > 0:
-            return gr.update(value=f"**✅ Aufgeräumt!** {deleted} alte Dateien wurden gelöscht.", visible=True)
-        else:
-            return gr.update(value="**ℹ️ Info:** Es wurden keine alten Dateien gefunden.", visible=True)
-    
-    def clear_exports():
-        """
-        Löscht alle Dateien im Export-Ordner sofort.
-        
-        Returns:
-        --------
-        gr.update
-            Update-Objekt für die Statusmeldung mit Anzahl der gelöschten Dateien
-        """
-        deleted = delete_all_exports()
-        if deleted > 0:
-            return gr.update(value=f"**✅ Erledigt!** Alle {deleted} Dateien wurden aus dem Export-Ordner gelöscht.", visible=True)
-        else:
-            return gr.update(value="**ℹ️ Info:** Der Export-Ordner ist bereits leer.", visible=True)
-
-    # Event-Handler
-    file_input.change(
-        fn=load_categories,
-        inputs=[file_input],
-        outputs=[category_checklist]
-    )
-    
-    # Entferne den automatischen Plot-Generator beim Datei-Upload
-    # und ersetze ihn durch eine einfache Willkommensnachricht
-    def show_welcome_message(file):
-        """Zeigt eine Willkommensnachricht nach dem Datei-Upload an"""
-        if file is None:
-            return gr.update(value="**Info:** Bitte eine JSON-Datei hochladen", visible=True)
-        return gr.update(
-            value="**✅ Datei geladen!** Bitte wählen Sie einen Diagrammtyp oder passen Sie die Parameter an.", 
-            visible=True
+        
+        file_input.change(
+            fn=show_welcome_message,
+            inputs=[file_input],
+            outputs=[message]
         )
-    
-    file_input.change(
-        fn=show_welcome_message,
-        inputs=[file_input],
-        outputs=[message]
-    )
-    
-    # Rest der Event-Handler bleibt unverändert
-    # Plot aktualisieren bei Änderungen der Eingaben
-    inputs = [file_input, plot_type, category_checklist, title_input, x_label, y_label, color_scheme]
-    
-    plot_type.change(
-        fn=update_plot,
-        inputs=inputs,
-        outputs=[output_plot, message]
-    )
-    
-    category_checklist.change(
-        fn=update_plot,
-        inputs=inputs,
-        outputs=[output_plot, message]
-    )
-    
-    # Weitere Änderungen (Titel, Labels, etc.)
-    for component in [title_input, x_label, y_label, color_scheme]:
-        component.change(
+        
+        # Rest der Event-Handler bleibt unverändert
+        # Plot aktualisieren bei Änderungen der Eingaben
+        inputs = [file_input, plot_type, category_checklist, title_input, x_label, y_label, color_scheme]
+        
+        # Alle Events, die die Vorschau zeichnen, teilen sich eine Warteschlange mit einem
+        # Platz: Figuren werden über Vorlagen- und Plot-Cache wiederverwendet und dürfen
+        # nicht gleichzeitig verändert und gerendert werden. Exporte zeichnen auf eigenen
+        # Figuren und laufen in einem eigenen Pool, die Vorschau wartet nicht auf sie
+        # Texteingaben (Titel, Labels) entprellt: jedes Event läuft sofort an und wartet
+        # selbst auf das Ende der Eingabe; nur das letzte erhöht die Render-Marke
+        render_tick = gr.State(0)
+        # Prüfsumme der zuletzt gesendeten Vorschau (pro Sitzung, bleibt auf dem Server)
+        preview_digest = gr.State(None)
+        gr.on(
+            triggers=[title_input.change, x_label.change, y_label.change],
+            fn=debounce_text_input,
+            outputs=[render_tick],
+            trigger_mode="multiple",
+            show_progress="hidden",
+            concurrency_limit=None
+        )
+        
+        # Ein gemeinsames Event für alle Auslöser eines Neuzeichnens (Diagrammtyp, Kategorien,
+        # Farbschema sofort; Texteingaben über die Render-Marke). Mit "always_last" wird eine
+        # Folge von Änderungen während eines laufenden Renderings zu einem Aufruf zusammengefasst
+        gr.on(
+            triggers=[plot_type.change, category_checklist.change, color_scheme.change, render_tick.change],
             fn=update_plot,
-            inputs=inputs,
-            outputs=[output_plot, message]
+            inputs=inputs + [preview_digest],
+            outputs=[output_plot, message, preview_digest],
+            trigger_mode="always_last",
+            concurrency_id="render",
+            concurrency_limit=1
         )
+        
+        # Export-Button für lokales Speichern
+        export_button.click(
+            fn=export_plot,
+            inputs=inputs + [export_format, export_dpi, output_filename, add_timestamp],
+            outputs=[export_success_info],
+            concurrency_id="disk",
+            concurrency_limit=2
+        )
+        
+        # Neuer Download-Button für Direktdownload
+        download_button.click(
+            fn=export_for_download,
+            inputs=inputs + [export_format, export_dpi, output_filename, add_timestamp],
+            outputs=[download_output, message],
+            concurrency_id="disk",
+            concurrency_limit=2
+        )
+        
+        # Funktionen zum Aufräumen des Export-Ordners - eigener Pool, damit ein Löschlauf
+        # keine Plätze der übrigen Events belegt und nie zwei Läufe gleichzeitig arbeiten
+        cleanup_button.click(
+            fn=cleanup_exports,
+            outputs=[cleanup_info],
+            concurrency_id="cleanup",
+            concurrency_limit=1
+        )
+        delete_all_button.click(
+            fn=clear_exports,
+            outputs=[cleanup_info],
+            concurrency_id="cleanup",
+            concurrency_limit=1
+        )
+        
+        # Beim Starten der App automatisch aufräumen - im Hintergrund, damit der Start
+        # nicht auf das Durchsuchen des export-Ordners warten muss
+        threading.Thread(
+            target=clean_export_dir,
+            kwargs={"max_age_days": 30},  # Lösche Dateien, die älter als 30 Tage sind
+            daemon=True
+        ).start()
+        
+        # matplotlib ebenfalls im Hintergrund aufwärmen, damit der erste Plot nicht wartet
+        threading.Thread(target=_warmup, daemon=True).start()
     
-    # Export-Button für lokales Speichern
-    export_button.click(
-        fn=export_plot,
-        inputs=inputs + [export_format, export_dpi, output_filename, add_timestamp],
-        outputs=[export_success_info]
-    )
-    
-    # Neuer Download-Button für Direktdownload
-    download_button.click(
-        fn=export_for_download,
-        inputs=inputs + [export_format, export_dpi, output_filename, add_timestamp],
-        outputs=[download_output, message]
-    )
-    
-    # Funktionen zum Aufräumen des Export-Ordners
-    cleanup_button.click(fn=cleanup_exports, outputs=[cleanup_info])
-    delete_all_button.click(fn=clear_exports, outputs=[cleanup_info])
-    
-    # Beim Starten der App automatisch aufräumen
-    clean_export_dir(max_age_days=30)  # Lösche Dateien, die älter als 30 Tage sind
-
-# launch()-Aufruf erfolgt in main.py
-if __name__ == "__main__":
-    interface.launch()
-
+    # Warteschlange begrenzen; leichte Events (Kategorien laden, Aufräumen, Entprellen)
+    # laufen parallel bis zur Anzahl der CPU-Kerne
+    interface.queue(default_concurrency_limit=os.cpu_count(), max_size=64)
+    return interface
@@ -3,8 +3,8 @@ Haupteinstiegspunkt für die Datenvisualisierungsanwendung.
 Startet die Gradio-Weboberfläche.
 """
 
-from frontend.gui import interface
+from frontend.gui import build_interface
 
 if __name__ == "__main__":
     # Starte die Weboberfläche
-    interface.launch()
+    build_interface().launch()